@@ -1,5 +1,9 @@
 """Candidates table transformation (vin_candidates)."""
 
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
 import pandas as pd
 
 from igh_data_transform.transformations._candidates_config import (
@@ -10,7 +14,6 @@ from igh_data_transform.transformations.cleanup import (
     drop_columns_by_name,
     drop_empty_columns,
     rename_columns,
-    replace_values,
 )
 
 # Temporal source columns consumed by expansion
@@ -29,6 +32,38 @@ _TEMPORAL_SOURCE_COLS = [
     "new_includeinpipeline",
 ]
 
+# Dropped before anything else; the FK source column is kept for resolution
+# and is removed by temporal expansion instead
+_UNUSED_BRONZE_COLS = [c for c in COLUMNS_TO_DROP if c not in _TEMPORAL_SOURCE_COLS]
+
+# (source column, valid_from) for each temporal group, oldest first
+_RDSTAGE_YEAR_COLS = [
+    ("vin_2019stagepcr", "2019-01-01"),
+    ("new_rdstage2021", "2021-01-01"),
+    ("new_2023currentrdstage", "2023-01-01"),
+    ("new_2024currentrdstage", "2024-01-01"),
+    ("_resolved_rdstage_2025", "2025-01-01"),
+]
+
+_PIPELINE_YEAR_COLS = [
+    ("vin_2019pcrpipelineinclusion", "2019-01-01"),
+    ("new_includeinpipeline2021", "2021-01-01"),
+    ("new_2023includeinevgendatabase", "2023-01-01"),
+    ("new_2024includeinpipeline", "2024-01-01"),
+    ("new_includeinpipeline", "2025-01-01"),
+]
+
+_EXPANSION_CONSUMED_COLS = frozenset(_TEMPORAL_SOURCE_COLS + ["_resolved_rdstage_2025"])
+
+# Every boundary date, oldest first; valid_from is ordered categorical over
+# these while expanding so sorts and merges compare small integer codes
+_BOUNDARY_DATES = sorted(
+    {vf for _, vf in _RDSTAGE_YEAR_COLS} | {vf for _, vf in _PIPELINE_YEAR_COLS}
+)
+
+# Columns produced by temporal expansion, in output order
+_EXPANDED_COLS = ["new_currentrdstage", "includeinpipeline", "valid_from", "valid_to"]
+
 _PRODUCT_TYPE_MAPPING = {
     "Dietary supplement": "Dietary supplements",
     "Diagnostic": "Diagnostics",
@@ -90,10 +125,9 @@ _RD_STAGE_MAPPING = {
     "N/A": "Not applicable",
 }
 
+# Applied after stripping surrounding whitespace from pressure values
 _PRESSURE_TYPE_MAPPING = {
-    "Negative pressure ": "Negative pressure",
-    "Positive pressure ": "Positive pressure",
-    "Not applicable ": "N/A",
+    "Not applicable": "N/A",
 }
 
 _APPROVAL_STATUS_CONSOLIDATION = {
@@ -137,6 +171,14 @@ _PRECLINICAL_RESULTS_CONSOLIDATION = {
     909670004.0: 909670002.0,  # Unavailable/unknown -> Unknown
 }
 
+# Option set code consolidations, keyed by (renamed) silver column
+_CODE_CONSOLIDATIONS = {
+    "approvalstatus": _APPROVAL_STATUS_CONSOLIDATION,
+    "approvingauthority": _APPROVING_AUTHORITY_CONSOLIDATION,
+    "indicationtype": _INDICATION_TYPE_CONSOLIDATION,
+    "preclinicalresultsstatus": _PRECLINICAL_RESULTS_CONSOLIDATION,
+}
+
 _PIPELINE_TEXT_TO_CODE = {
     "Yes": 100000000,
     "No": 100000001,
@@ -152,11 +194,40 @@ _TEXT_PIPELINE_COLS = [
 _PIPELINE_CODE_NORMALIZATION = {862890000: 100000000}
 _CODE_PIPELINE_COLS = ["new_2024includeinpipeline"]
 
-# Option set rows to remove (by code)
-_INDICATION_TYPE_CODES_TO_REMOVE = {100000003, 100000004, 100000005}
-_PRECLINICAL_RESULTS_CODES_TO_REMOVE = {909670004}
-_APPROVAL_STATUS_CODES_TO_REMOVE = {862890001}
-_APPROVING_AUTHORITY_CODES_TO_REMOVE = {909670002}
+# Option set rows to remove (by code), keyed by option set table
+_OPTION_SET_CODES_TO_REMOVE = {
+    "_optionset_new_indicationtype": {100000003, 100000004, 100000005},
+    "_optionset_vin_preclinicalresultsstatus": {909670004},
+    "_optionset_vin_approvalstatus": {862890001},
+    "_optionset_vin_approvingauthority": {909670002},
+}
+
+
+def _standardize_rd_stage(stage):
+    """Roll an RD stage label up to its standardized stage name."""
+    stage = _RD_STAGE_MAPPING.get(stage, stage)
+    # Strip remaining " - ProductType" suffixes and re-map the exposed name
+    if isinstance(stage, str) and " - " in stage:
+        stage = stage.split(" - ")[0]
+        stage = _RD_STAGE_MAPPING.get(stage, stage)
+    return stage
+
+
+def _standardize_labels(
+    series: pd.Series,
+    mapping: dict | Callable[[Any], Any],
+) -> pd.Series:
+    """Map low-cardinality labels once per distinct value.
+
+    The series is viewed as categorical so the mapping (a dict, or a
+    function of one label) runs over its categories instead of every row.
+    Labels missing from a dict pass through, and a function mapping must
+    return NaN unchanged (newer pandas may call it once for the null
+    code), so nulls stay null. The result is returned as object dtype.
+    """
+    mapper = mapping if callable(mapping) else (lambda v: mapping.get(v, v))
+    categories = series.astype("category")
+    return categories.map(mapper).astype(object)
 
 
 def _resolve_rdstage_fk(
@@ -171,9 +242,9 @@ def _resolve_rdstage_fk(
     lookup = rdstageproducts.set_index("vin_rdstageproductid")["vin_name"]
     # Strip product suffix: 'Phase III - Drugs' -> 'Phase III'
     lookup = lookup.str.rsplit(" - ", n=1).str[0]
-    df = df.copy()
-    df["_resolved_rdstage_2025"] = df["_vin_currentrndstage_value"].map(lookup)
-    return df
+    return df.assign(
+        _resolved_rdstage_2025=df["_vin_currentrndstage_value"].map(lookup)
+    )
 
 
 def _normalize_pipeline_cols(df: pd.DataFrame) -> pd.DataFrame:
@@ -182,7 +253,9 @@ def _normalize_pipeline_cols(df: pd.DataFrame) -> pd.DataFrame:
     Text columns (2019, 2023) are mapped from "Yes"/"No"/"Pending" to codes.
     Code columns with non-standard schemes (2024: 862890000=Yes) are remapped.
     """
-    df = df.copy()
+    # Shallow copy: every write below replaces a whole column, so the
+    # caller's arrays are never touched
+    df = df.copy(deep=False)
     for col in _TEXT_PIPELINE_COLS:
         if col in df.columns:
             df[col] = df[col].map(_PIPELINE_TEXT_TO_CODE)
@@ -196,89 +269,105 @@ def _normalize_pipeline_cols(df: pd.DataFrame) -> pd.DataFrame:
     _2021_col = "new_includeinpipeline2021"
     if _2019_col in df.columns and _2021_col in df.columns:
         mask = (df[_2019_col] == 100000000) & (df[_2021_col] == 100000001)
-        df.loc[mask, _2021_col] = 100000000
+        df[_2021_col] = df[_2021_col].mask(mask, 100000000)
 
     return df
 
 
+def _melt_temporal_group(
+    df: pd.DataFrame,
+    configs: list[tuple[str, str]],
+    value_name: str,
+) -> pd.DataFrame:
+    """Unpivot one temporal group into (_row, valid_from, value) rows.
+
+    Only non-null values are kept, so each output row is a boundary year
+    at which the group has known data.  ``_row`` is the positional index
+    of the source candidate row.
+    """
+    # Gather each year's non-null cells straight into flat arrays and wrap
+    # them once, rather than melting every cell and filtering afterwards
+    rows, codes, values = [], [], []
+    for col, vf in configs:
+        if col not in df.columns:
+            continue
+        column = df[col].to_numpy()
+        present = pd.notna(column).nonzero()[0]
+        rows.append(present)
+        values.append(column[present])
+        codes.append(np.full(len(present), _BOUNDARY_DATES.index(vf)))
+    if not rows:
+        rows, codes, values = [np.empty(0, dtype=np.intp)], [np.empty(0, int)], [[]]
+    return pd.DataFrame(
+        {
+            "_row": np.concatenate(rows),
+            "valid_from": pd.Categorical.from_codes(
+                np.concatenate(codes), categories=_BOUNDARY_DATES, ordered=True
+            ),
+            value_name: np.concatenate(values),
+        }
+    )
+
+
 def _expand_temporal_rows(df: pd.DataFrame) -> pd.DataFrame:
     """Create time-versioned rows via cross-product of temporal groups.
 
-    Handles two temporal groups: RD stage (4 year-columns) and
-    includeinpipeline (3 year-columns).  For each candidate the union of
+    Handles two temporal groups: RD stage (5 year-columns) and
+    includeinpipeline (5 year-columns).  For each candidate the union of
     boundary years from both groups is collected and at each boundary the
     most recent known value for each group is forward-filled.
 
     Produces one row per candidate per boundary year.
-    valid_to = start of candidate's next boundary (None for latest).
+    valid_to = start of candidate's next boundary (NaN for latest).
+    Candidates with no temporal data keep a single row with null
+    valid_from/valid_to, and values before a group's first known year
+    are left null.
     Must be called before column renaming (uses original bronze names).
     """
-    _rdstage_cols = [
-        ("vin_2019stagepcr", "2019-01-01"),
-        ("new_rdstage2021", "2021-01-01"),
-        ("new_2023currentrdstage", "2023-01-01"),
-        ("new_2024currentrdstage", "2024-01-01"),
-        ("_resolved_rdstage_2025", "2025-01-01"),
-    ]
-
-    _pipeline_cols = [
-        ("vin_2019pcrpipelineinclusion", "2019-01-01"),
-        ("new_includeinpipeline2021", "2021-01-01"),
-        ("new_2023includeinevgendatabase", "2023-01-01"),
-        ("new_2024includeinpipeline", "2024-01-01"),
-        ("new_includeinpipeline", "2025-01-01"),
-    ]
-
-    def _year_map(row: pd.Series, configs: list[tuple[str, str]]) -> dict:
-        """Build {valid_from: value} for non-null year columns."""
-        return {
-            vf: row[col]
-            for col, vf in configs
-            if col in row.index and pd.notna(row[col])
-        }
-
-    def _forward_fill(year_map: dict, boundaries: list[str]) -> list:
-        """At each boundary return the most-recent known value."""
-        result = []
-        last = None
-        for b in boundaries:
-            if b in year_map:
-                last = year_map[b]
-            result.append(last)
-        return result
-
-    rows_out: list[dict] = []
-    cols_to_drop = _TEMPORAL_SOURCE_COLS + ["_resolved_rdstage_2025"]
     # Columns to carry through (everything except temporal source cols)
-    keep_cols = [c for c in df.columns if c not in cols_to_drop]
-
-    for _, row in df.iterrows():
-        rd_map = _year_map(row, _rdstage_cols)
-        pl_map = _year_map(row, _pipeline_cols)
-
-        boundaries = sorted(set(list(rd_map.keys()) + list(pl_map.keys())))
-
-        if not boundaries:
-            out = {c: row[c] for c in keep_cols}
-            out["new_currentrdstage"] = None
-            out["includeinpipeline"] = None
-            out["valid_from"] = None
-            out["valid_to"] = None
-            rows_out.append(out)
-            continue
-
-        rd_vals = _forward_fill(rd_map, boundaries)
-        pl_vals = _forward_fill(pl_map, boundaries)
-
-        for i, boundary in enumerate(boundaries):
-            out = {c: row[c] for c in keep_cols}
-            out["new_currentrdstage"] = rd_vals[i]
-            out["includeinpipeline"] = pl_vals[i]
-            out["valid_from"] = boundary
-            out["valid_to"] = boundaries[i + 1] if i + 1 < len(boundaries) else None
-            rows_out.append(out)
-
-    return pd.DataFrame(rows_out)
+    keep_cols = [c for c in df.columns if c not in _EXPANSION_CONSUMED_COLS]
+
+    rd_long = _melt_temporal_group(df, _RDSTAGE_YEAR_COLS, "new_currentrdstage")
+    pl_long = _melt_temporal_group(df, _PIPELINE_YEAR_COLS, "includeinpipeline")
+
+    # Boundaries are the union of years with data in either group; each
+    # group's value is then forward-filled across the candidate's timeline.
+    key = ["_row", "valid_from"]
+    expanded = (
+        pd.concat([rd_long[key], pl_long[key]])
+        .drop_duplicates()
+        .merge(rd_long, on=key, how="left", validate="one_to_one")
+        .merge(pl_long, on=key, how="left", validate="one_to_one")
+        .sort_values(key, kind="stable")
+    )
+    # Frame is already ordered by (_row, valid_from), so the groupbys skip
+    # re-sorting; valid_to is a lead() of valid_from within each candidate.
+    # Null years were dropped by the melt, so the next row is always the
+    # next populated boundary and gaps (e.g. 2021 -> 2024) need no scan.
+    by_row = expanded.groupby("_row", sort=False)
+    filled = by_row[["new_currentrdstage", "includeinpipeline"]].ffill()
+    valid_to = by_row["valid_from"].shift(-1)
+    expanded = expanded.assign(
+        new_currentrdstage=filled["new_currentrdstage"],
+        includeinpipeline=filled["includeinpipeline"],
+        valid_to=valid_to,
+    )
+
+    # Candidates without any temporal data still get a single row
+    missing = pd.RangeIndex(len(df)).difference(expanded["_row"])
+    if len(missing):
+        expanded = pd.concat(
+            [expanded, pd.DataFrame({"_row": missing})], ignore_index=True
+        ).sort_values("_row", kind="stable")
+
+    # Generated columns overwrite same-named bronze columns (e.g. the SCD2
+    # valid_from/valid_to) in place, and are appended otherwise.
+    expanded = expanded.reset_index(drop=True)
+    result = df[keep_cols].iloc[expanded["_row"]].reset_index(drop=True)
+    result[_EXPANDED_COLS] = expanded[_EXPANDED_COLS].astype(
+        {"valid_from": object, "valid_to": object}
+    )
+    return result
 
 
 def transform_candidates(
@@ -296,9 +385,13 @@ def transform_candidates(
     Returns:
         Tuple of (transformed DataFrame, dict of cleaned option sets).
     """
-    # 0. Filter deleted records (statecode != 0)
+    # 0. Drop unused bronze columns in one selection up front so they are
+    # never copied by the row filter, FK resolution or expansion
+    df = drop_columns_by_name(df, _UNUSED_BRONZE_COLS)
+
+    # 0a. Filter deleted records (statecode != 0)
     if "statecode" in df.columns:
-        df = df[df["statecode"] == 0].copy()
+        df = df[df["statecode"] == 0]
 
     # 1. Resolve FK for 2025 RD stage
     if lookup_tables and "vin_rdstageproducts" in lookup_tables:
@@ -310,8 +403,7 @@ def transform_candidates(
     # 2. Temporal expansion (reads original bronze column names)
     df = _expand_temporal_rows(df)
 
-    # 3. Drop columns (temporal sources already consumed by expansion)
-    df = drop_columns_by_name(df, COLUMNS_TO_DROP)
+    # 3. Drop empty columns (temporal sources already consumed by expansion)
     df = drop_empty_columns(df, preserve=["valid_to", "valid_from"])
 
     # 3b. Synthesize key clinical trial link
@@ -325,28 +417,23 @@ def transform_candidates(
 
     # 5. Standardize new_currentrdstage (from SCD2 expansion)
     if "new_currentrdstage" in df.columns:
-        df = replace_values(df, "new_currentrdstage", _RD_STAGE_MAPPING)
-        # Strip remaining " - ProductType" suffixes
-        mask = df["new_currentrdstage"].str.contains(" - ", na=False)
-        df.loc[mask, "new_currentrdstage"] = (
-            df.loc[mask, "new_currentrdstage"].str.split(" - ").str[0]
+        df["new_currentrdstage"] = _standardize_labels(
+            df["new_currentrdstage"], _standardize_rd_stage
         )
-        # Re-apply mapping for values that were only exposed after stripping
-        df = replace_values(df, "new_currentrdstage", _RD_STAGE_MAPPING)
 
     # 6. Standardize other categorical values
     if "pressuretype" in df.columns:
-        df = replace_values(df, "pressuretype", _PRESSURE_TYPE_MAPPING)
-    if "product" in df.columns:
-        df = replace_values(df, "product", _PRODUCT_TYPE_MAPPING)
-
-    # Consolidate option set code values
-    if "approvalstatus" in df.columns:
-        df = replace_values(df, "approvalstatus", _APPROVAL_STATUS_CONSOLIDATION)
-    if "approvingauthority" in df.columns:
-        df = replace_values(
-            df, "approvingauthority", _APPROVING_AUTHORITY_CONSOLIDATION
+        df["pressuretype"] = _standardize_labels(
+            df["pressuretype"].str.strip(), _PRESSURE_TYPE_MAPPING
         )
+    if "product" in df.columns:
+        df["product"] = _standardize_labels(df["product"], _PRODUCT_TYPE_MAPPING)
+
+    # Consolidate option set code values (df is a fresh frame after the
+    # rename, so columns are replaced in place without a copy per column)
+    for col, consolidation in _CODE_CONSOLIDATIONS.items():
+        if col in df.columns:
+            df[col] = df[col].replace(consolidation)
 
     # 7. Derive boolean include_in_pipeline from option set codes
     if "includeinpipeline" in df.columns:
@@ -355,42 +442,14 @@ def transform_candidates(
             df["includeinpipeline"].isin(_pipeline_codes).astype(int)
         )
 
-    # 8. Post-filter consolidations
-    if "indicationtype" in df.columns:
-        df = replace_values(df, "indicationtype", _INDICATION_TYPE_CONSOLIDATION)
-    if "preclinicalresultsstatus" in df.columns:
-        df = replace_values(
-            df, "preclinicalresultsstatus", _PRECLINICAL_RESULTS_CONSOLIDATION
-        )
-
     # Clean option sets
     cleaned_option_sets: dict[str, pd.DataFrame] = {}
 
     if option_sets:
-        _dedup_option_set(
-            option_sets,
-            cleaned_option_sets,
-            "_optionset_new_indicationtype",
-            _INDICATION_TYPE_CODES_TO_REMOVE,
-        )
-        _dedup_option_set(
-            option_sets,
-            cleaned_option_sets,
-            "_optionset_vin_preclinicalresultsstatus",
-            _PRECLINICAL_RESULTS_CODES_TO_REMOVE,
-        )
-        _dedup_option_set(
-            option_sets,
-            cleaned_option_sets,
-            "_optionset_vin_approvalstatus",
-            _APPROVAL_STATUS_CODES_TO_REMOVE,
-        )
-        _dedup_option_set(
-            option_sets,
-            cleaned_option_sets,
-            "_optionset_vin_approvingauthority",
-            _APPROVING_AUTHORITY_CODES_TO_REMOVE,
-        )
+        for table_name, codes_to_remove in _OPTION_SET_CODES_TO_REMOVE.items():
+            _dedup_option_set(
+                option_sets, cleaned_option_sets, table_name, codes_to_remove
+            )
 
     return df, cleaned_option_sets
 
@@ -403,6 +462,6 @@ def _dedup_option_set(
 ) -> None:
     """Remove duplicate codes from an option set table."""
     if table_name in option_sets:
-        os_df = option_sets[table_name].copy()
+        os_df = option_sets[table_name]
         os_df = os_df[~os_df["code"].isin(codes_to_remove)]
         cleaned[table_name] = os_df.reset_index(drop=True)
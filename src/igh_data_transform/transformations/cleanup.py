@@ -16,8 +16,7 @@ def drop_columns_by_name(
     Returns:
         DataFrame with specified columns removed. Columns not present are ignored.
     """
-    cols_to_drop = [c for c in columns if c in df.columns]
-    return df.drop(columns=cols_to_drop)
+    return df.drop(columns=columns, errors="ignore")
 
 
 def drop_empty_columns(
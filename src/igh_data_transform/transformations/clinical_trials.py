@@ -1,12 +1,14 @@
 """Clinical trials table transformation (vin_clinicaltrials)."""
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
 
 from igh_data_transform.transformations.cleanup import (
     drop_columns_by_name,
     drop_empty_columns,
     rename_columns,
-    replace_values,
 )
 
 _COLUMNS_TO_DROP = [
@@ -84,16 +86,77 @@ _CT_STATUS_CONSOLIDATION = {
 }
 
 # Codes to remove from the option set (consolidated into Active)
-_CT_STATUS_CODES_TO_REMOVE = {
-    100000001,
-    100000002,
-    100000003,
-    100000004,
-    100000005,
-    100000006,
-    909670003,
+_CT_STATUS_CODES_TO_REMOVE = frozenset(
+    {
+        100000001,
+        100000002,
+        100000003,
+        100000004,
+        100000005,
+        100000006,
+        909670003,
+    }
+)
+
+
+# Classifier vocabularies, built once at import rather than on every call
+_PHASE_NA_TERMS = frozenset(
+    {"N/A", "NOT APPLICABLE", "PHASE N/A", "PHASE: N/A", "NA", "0", "PHASE 0"}
+)
+_PHASE_UNKNOWN_TERMS = frozenset(
+    {"UNKNOWN", "PHASE UNSPECIFIED", "OTHER", "NOT SELECTED"}
+)
+_PHASE_III_IV_TERMS = ("III/IV", "3/4")
+_PHASE_II_III_TERMS = ("II/III", "2/3", "PHASE2|PHASE3")
+_PHASE_I_II_TERMS = ("I/II", "1/2", "1 AND 2", "PHASE1|PHASE2")
+_PHASE_IV_TERMS = ("PHASE 4", "PHASE IV", "POST-MARKET", "POST MARKETING")
+_PHASE_III_TERMS = ("PHASE 3", "PHASE III", "PHASE3")
+_PHASE_II_TERMS = ("PHASE 2", "PHASE II", "PHASR II", "PHASE2")
+_PHASE_I_TERMS = ("PHASE 1", "PHASE I", "EARLY_PHASE1", "PHASE1")
+
+# Exact cleaned values that short-circuit the ordered checks in
+# _classify_phase_token; each entry must agree with what those checks return
+_PHASE_EXACT = {
+    **dict.fromkeys(_PHASE_NA_TERMS, "N/A"),
+    **dict.fromkeys(_PHASE_UNKNOWN_TERMS, "Unknown"),
+    **dict.fromkeys(("I", "1", "PHASE 1", "PHASE I", "PHASE1"), "Phase I"),
+    **dict.fromkeys(("EARLY_PHASE1", "EARLY PHASE 1"), "Phase I"),
+    **dict.fromkeys(("II", "2", "PHASE 2", "PHASE II", "PHASE2"), "Phase II"),
+    **dict.fromkeys(("III", "3", "PHASE 3", "PHASE III", "PHASE3"), "Phase III"),
+    **dict.fromkeys(("IV", "4", "PHASE 4", "PHASE IV"), "Phase IV"),
+    **dict.fromkeys(("1/2", "12", "PHASE I/II", "PHASE1|PHASE2"), "Phase I/II"),
+    **dict.fromkeys(("2/3", "PHASE II/III", "PHASE2|PHASE3"), "Phase II/III"),
+    **dict.fromkeys(("3/4", "PHASE III/IV"), "Phase III/IV"),
 }
 
+_OLDER_ADULT_TERMS = (
+    "OLDER ADULT",
+    "OLDER_ADULT",
+    "(OLDER)",
+    "65",
+    "64",
+    "60",
+    "55",
+    "50",
+    "49",
+    "48",
+)
+_ADOLESCENT_AGES = ("14", "15", "16", "17")
+
+_BOTH_GENDER_TERMS = ("BOTH", "ALL", "AND FEMALE", "AND MALE")
+
+_INTERVENTIONAL_VARIANTS = frozenset(
+    {
+        "INTERVENTIONAL",
+        "INTERVENTIONAL STUDY",
+        "INTERVENTION",
+        "INTERVENTIONAL CLINICAL TRIAL OF MEDICINAL PRODUCT",
+    }
+)
+_OBSERVATIONAL_VARIANTS = frozenset(
+    {"OBSERVATIONAL", "OBSERVATIONAL STUDY", "OBSERVATIONAL NON INVASIVE"}
+)
+
 
 def _synthesize_phase(val) -> str:
     """Standardize clinical trial phase values."""
@@ -102,29 +165,29 @@ def _synthesize_phase(val) -> str:
 
     v = str(val).upper().strip().replace("\n", " ")
 
+    # Common canonical spellings resolve with one lookup
+    label = _PHASE_EXACT.get(v)
+    if label is not None:
+        return label
+    return _classify_phase_token(v)
+
+
+def _classify_phase_token(v: str) -> str:
+    """Classify a cleaned, uppercased phase value by ordered pattern checks."""
     # N/A (exact match)
-    na_terms = {
-        "N/A",
-        "NOT APPLICABLE",
-        "PHASE N/A",
-        "PHASE: N/A",
-        "NA",
-        "0",
-        "PHASE 0",
-    }
-    if v in na_terms:
+    if v in _PHASE_NA_TERMS:
         return "N/A"
 
     # Unknown (exact match)
-    if v in {"UNKNOWN", "PHASE UNSPECIFIED", "OTHER", "NOT SELECTED"}:
+    if v in _PHASE_UNKNOWN_TERMS:
         return "Unknown"
 
     # Combined phases - check most specific first to avoid substring collision
-    if any(x in v for x in ["III/IV", "3/4"]):
+    if any(x in v for x in _PHASE_III_IV_TERMS):
         return "Phase III/IV"
-    if any(x in v for x in ["II/III", "2/3", "PHASE2|PHASE3"]):
+    if any(x in v for x in _PHASE_II_III_TERMS):
         return "Phase II/III"
-    if any(x in v for x in ["I/II", "1/2", "1 AND 2", "PHASE1|PHASE2"]) or v == "12":
+    if any(x in v for x in _PHASE_I_II_TERMS) or v == "12":
         return "Phase I/II"
 
     # Specialized study types (before single-phase checks to avoid "I" collisions)
@@ -139,20 +202,13 @@ def _synthesize_phase(val) -> str:
 
     # Single phases - check highest first; use substring for multi-word,
     # exact match for single-char to avoid "I" in "PHASE IV" collisions
-    phase_iv_terms = ["PHASE 4", "PHASE IV", "POST-MARKET", "POST MARKETING"]
-    if any(x in v for x in phase_iv_terms) or v in {"IV", "4"}:
+    if any(x in v for x in _PHASE_IV_TERMS) or v in {"IV", "4"}:
         return "Phase IV"
-
-    phase_iii_terms = ["PHASE 3", "PHASE III", "PHASE3"]
-    if any(x in v for x in phase_iii_terms) or v in {"III", "3"}:
+    if any(x in v for x in _PHASE_III_TERMS) or v in {"III", "3"}:
         return "Phase III"
-
-    phase_ii_terms = ["PHASE 2", "PHASE II", "PHASR II", "PHASE2"]
-    if any(x in v for x in phase_ii_terms) or v in {"II", "2"}:
+    if any(x in v for x in _PHASE_II_TERMS) or v in {"II", "2"}:
         return "Phase II"
-
-    phase_i_terms = ["PHASE 1", "PHASE I", "EARLY_PHASE1", "PHASE1"]
-    if any(x in v for x in phase_i_terms) or v in {"I", "1"}:
+    if any(x in v for x in _PHASE_I_TERMS) or v in {"I", "1"}:
         return "Phase I"
 
     return "Unknown"
@@ -162,25 +218,16 @@ def _synthesize_age_groups(val) -> str:
     """Standardize age group values."""
     if pd.isna(val) or val == "None":
         return "Unknown"
+    return _age_group_of(str(val))
 
-    v = str(val).upper().replace("\xa0", " ").replace("Â", " ").strip()
+
+@lru_cache(maxsize=1024)
+def _age_group_of(text: str) -> str:
+    """Classify a non-null age value; cached as the vocabulary is small."""
+    v = text.upper().replace("\xa0", " ").replace("Â", " ").strip()
 
     # Older adults: 45 >
-    if any(
-        x in v
-        for x in [
-            "OLDER ADULT",
-            "OLDER_ADULT",
-            "(OLDER)",
-            "65",
-            "64",
-            "60",
-            "55",
-            "50",
-            "49",
-            "48",
-        ]
-    ):
+    if any(x in v for x in _OLDER_ADULT_TERMS):
         return "Older adults: 45 >"
     if "YEARS AND OLDER" in v or "YEARS AND OVER" in v:
         return "Older adults: 45 >"
@@ -197,7 +244,7 @@ def _synthesize_age_groups(val) -> str:
         return "Young Adults 18 - 45"
 
     # Adolescents
-    if "ADOLESCENT" in v or any(x in v for x in ["14", "15", "16", "17"]):
+    if "ADOLESCENT" in v or any(x in v for x in _ADOLESCENT_AGES):
         return "Adolescents"
 
     # Children
@@ -219,11 +266,16 @@ def _synthesize_gender(val) -> str:
     """Standardize gender values."""
     if pd.isna(val) or val == "None":
         return "Unknown"
+    return _gender_of(str(val))
+
 
-    v = str(val).upper().replace("<BR>", " ").strip()
+@lru_cache(maxsize=1024)
+def _gender_of(text: str) -> str:
+    """Classify a non-null gender value; cached as the vocabulary is small."""
+    v = text.upper().replace("<BR>", " ").strip()
 
     # Simple keyword checks
-    if any(x in v for x in ["BOTH", "ALL", "AND FEMALE", "AND MALE"]):
+    if any(x in v for x in _BOTH_GENDER_TERMS):
         return "Both"
 
     # Compound patterns: "FEMALE: YES" contains "MALE: YES" as substring,
@@ -254,26 +306,33 @@ def _clean_study_types(val):
 
     v_clean = str(val).strip().upper()
 
-    interventional_variants = [
-        "INTERVENTIONAL",
-        "INTERVENTIONAL STUDY",
-        "INTERVENTION",
-        "INTERVENTIONAL CLINICAL TRIAL OF MEDICINAL PRODUCT",
-    ]
-    if v_clean in interventional_variants:
+    if v_clean in _INTERVENTIONAL_VARIANTS:
         return "Interventional"
-
-    observational_variants = [
-        "OBSERVATIONAL",
-        "OBSERVATIONAL STUDY",
-        "OBSERVATIONAL NON INVASIVE",
-    ]
-    if v_clean in observational_variants:
+    if v_clean in _OBSERVATIONAL_VARIANTS:
         return "Observational"
 
     return val
 
 
+def _classify_distinct(series: pd.Series, classify) -> pd.Series:
+    """Apply a per-value classifier once per distinct value of a column.
+
+    Free-text columns repeat a small vocabulary across many rows, so rows
+    are grouped by the type and string form of their value, the classifier
+    runs on one representative per group, and labels are broadcast back.
+    Grouping by type as well as text keeps values that hash alike (1, 1.0,
+    True) apart, and each kind of null (None, NaN) is classified as itself,
+    so every row gets the label a row-wise ``apply`` would give it.
+    """
+    type_codes, type_uniques = pd.factorize(series.map(type))
+    text_codes, _ = pd.factorize(series.astype(str))
+    keys = text_codes.astype(np.int64) * max(len(type_uniques), 1) + type_codes
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    labels = np.empty(len(first), dtype=object)
+    labels[:] = [classify(v) for v in series.iloc[first]]
+    return pd.Series(labels[inverse], index=series.index, name=series.name)
+
+
 def transform_clinical_trials(
     df: pd.DataFrame,
     option_sets: dict[str, pd.DataFrame] | None = None,
@@ -287,7 +346,10 @@ def transform_clinical_trials(
     Returns:
         Tuple of (transformed DataFrame, dict of cleaned option sets).
     """
-    df = df.copy()
+    # Drop unused bronze columns first; this selection is the frame's only
+    # copy, and every later step replaces whole columns rather than writing
+    # into the caller's arrays
+    df = drop_columns_by_name(df, _COLUMNS_TO_DROP)
 
     # Strip whitespace from age column before synthesis
     if "new_age" in df.columns:
@@ -295,20 +357,21 @@ def transform_clinical_trials(
 
     # Apply synthesis functions
     if "vin_ctphase" in df.columns:
-        df["vin_ctphase"] = df["vin_ctphase"].apply(_synthesize_phase)
+        df["vin_ctphase"] = _classify_distinct(df["vin_ctphase"], _synthesize_phase)
     if "new_age" in df.columns:
-        df["new_age"] = df["new_age"].apply(_synthesize_age_groups)
+        df["new_age"] = _classify_distinct(df["new_age"], _synthesize_age_groups)
     if "new_sex" in df.columns:
-        df["new_sex"] = df["new_sex"].apply(_synthesize_gender)
+        df["new_sex"] = _classify_distinct(df["new_sex"], _synthesize_gender)
     if "new_studytype" in df.columns:
-        df["new_studytype"] = df["new_studytype"].apply(_clean_study_types)
+        df["new_studytype"] = _classify_distinct(
+            df["new_studytype"], _clean_study_types
+        )
 
     # Consolidate CT status values
     if "vin_ctstatus" in df.columns:
-        df = replace_values(df, "vin_ctstatus", _CT_STATUS_CONSOLIDATION)
+        df["vin_ctstatus"] = df["vin_ctstatus"].replace(_CT_STATUS_CONSOLIDATION)
 
-    # Drop columns
-    df = drop_columns_by_name(df, _COLUMNS_TO_DROP)
+    # Drop columns left empty after synthesis
     df = drop_empty_columns(df, preserve=["valid_to"])
 
     # Rename columns
@@ -318,7 +381,8 @@ def transform_clinical_trials(
     cleaned_option_sets: dict[str, pd.DataFrame] = {}
 
     if option_sets and "_optionset_vin_ctstatus" in option_sets:
-        os_df = option_sets["_optionset_vin_ctstatus"].copy()
+        # Boolean indexing already returns a new frame, so no defensive copy
+        os_df = option_sets["_optionset_vin_ctstatus"]
         os_df = os_df[~os_df["code"].isin(_CT_STATUS_CODES_TO_REMOVE)]
         cleaned_option_sets["_optionset_vin_ctstatus"] = os_df.reset_index(drop=True)
 
@@ -54,6 +54,25 @@ class DatabaseManager:
             return self.connection.execute(query, params)
         return self.connection.execute(query)
 
+    def executemany(self, query: str, seq_of_params) -> sqlite3.Cursor:
+        """Execute a SQL statement once per parameter set in a single call.
+
+        Args:
+            query: SQL statement to execute.
+            seq_of_params: Iterable of parameter tuples, one per execution.
+
+        Returns:
+            Cursor for the executed statement.
+
+        Raises:
+            RuntimeError: If called outside of context manager.
+        """
+        if self.connection is None:
+            raise RuntimeError(
+                "Database connection not established. Use context manager."
+            )
+        return self.connection.executemany(query, seq_of_params)
+
     def commit(self) -> None:
         """Commit the current transaction.
 
@@ -36,6 +36,12 @@ def temp_db_path(tmp_path: Path) -> Path:
     return tmp_path / "test.db"
 
 
+@pytest.fixture
+def memory_db_path() -> str:
+    """Path for a private in-memory SQLite database (no filesystem I/O)."""
+    return ":memory:"
+
+
 @pytest.fixture
 def temp_bronze_db(tmp_path: Path) -> Path:
     """Create a temporary Bronze database path."""
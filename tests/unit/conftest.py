@@ -0,0 +1,36 @@
+"""Shared pytest fixtures for unit tests."""
+
+from collections.abc import Callable
+
+import pandas as pd
+import pytest
+
+
+def _frame_factory(build: Callable[[], pd.DataFrame | dict[str, pd.DataFrame]]):
+    """Call ``build`` once and return a factory handing out copies of it.
+
+    Each call returns a shallow copy, so a test that assigns columns cannot
+    change what later tests see. Frames accept column overrides, either as
+    a dict or as keyword arguments. A dict of frames (option sets, lookup
+    tables) comes back as a new dict of shallow copies and rejects
+    overrides with TypeError.
+    """
+    base = build()
+
+    def make(overrides=None, **columns):
+        if isinstance(base, dict):
+            if overrides or columns:
+                raise TypeError("Column overrides apply to a single frame, not a dict")
+            return {name: frame.copy(deep=False) for name, frame in base.items()}
+        df = base.copy(deep=False)
+        for col, values in {**(overrides or {}), **columns}.items():
+            df[col] = values
+        return df
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def frame_factory():
+    """Build-once, copy-per-call factory for test input frames."""
+    return _frame_factory
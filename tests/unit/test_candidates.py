@@ -1,6 +1,8 @@
 """Tests for candidates transformation."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from igh_data_transform.transformations.candidates import (
     _expand_temporal_rows,
@@ -162,6 +164,16 @@ class TestNormalizePipelineCols:
         result = _normalize_pipeline_cols(df)
         assert result["new_includeinpipeline2021"].iloc[0] == 100000000
 
+    def test_2021_override_does_not_modify_original(self):
+        df = pd.DataFrame(
+            {
+                "vin_2019pcrpipelineinclusion": ["Yes"],
+                "new_includeinpipeline2021": [100000001],
+            }
+        )
+        _normalize_pipeline_cols(df)
+        assert df["new_includeinpipeline2021"].iloc[0] == 100000001
+
 
 class TestExpandTemporalRows:
     """Tests for _expand_temporal_rows function.
@@ -171,58 +183,35 @@ class TestExpandTemporalRows:
     The cross-product expansion also handles includeinpipeline columns.
     """
 
-    def test_candidate_with_all_temporal_years(self):
-        """Candidate with data in 2023, 2024, and 2025 produces 3 rows."""
-        df = pd.DataFrame(
-            {
-                "vin_candidateid": ["cand-1"],
-                "vin_name": ["CandA"],
-                "new_2023currentrdstage": ["Phase I"],
-                "new_2024currentrdstage": ["Phase II"],
-                "_resolved_rdstage_2025": ["Phase III"],
-                "new_includeinpipeline": [100000000],
-                "vin_product": ["Drugs"],
-            }
-        )
-        result = _expand_temporal_rows(df)
-        assert len(result) == 3
-        assert "new_currentrdstage" in result.columns
-        stages = list(result["new_currentrdstage"])
-        assert "Phase I" in stages
-        assert "Phase II" in stages
-        assert "Phase III" in stages
-
-    def test_candidate_with_only_some_years(self):
-        """Only years with non-null data (from either group) produce rows."""
-        df = pd.DataFrame(
-            {
-                "vin_candidateid": ["cand-1"],
-                "vin_name": ["CandA"],
-                "new_2023currentrdstage": [None],
-                "new_2024currentrdstage": ["Phase II"],
-                "_resolved_rdstage_2025": ["Phase III"],
-                "new_includeinpipeline": [100000000],
-                "vin_product": ["Drugs"],
-            }
-        )
-        result = _expand_temporal_rows(df)
-        assert len(result) == 2
-
-    def test_candidate_with_only_current_year(self):
-        """Candidate with only 2025 data produces 1 row."""
+    @pytest.mark.parametrize(
+        "stages,expected_stages",
+        [
+            (
+                ["Phase I", "Phase II", "Phase III"],
+                ["Phase I", "Phase II", "Phase III"],
+            ),
+            ([None, "Phase II", "Phase III"], ["Phase II", "Phase III"]),
+            ([None, None, "Phase III"], ["Phase III"]),
+            (["Phase I", None, "Phase III"], ["Phase I", "Phase III"]),
+        ],
+        ids=["all_years", "some_years", "current_year_only", "null_middle_year"],
+    )
+    def test_one_row_per_populated_year(self, stages, expected_stages):
+        """Only years with non-null data produce rows, in year order."""
+        stage_2023, stage_2024, stage_2025 = stages
         df = pd.DataFrame(
             {
                 "vin_candidateid": ["cand-1"],
                 "vin_name": ["CandA"],
-                "new_2023currentrdstage": [None],
-                "new_2024currentrdstage": [None],
-                "_resolved_rdstage_2025": ["Phase III"],
+                "new_2023currentrdstage": [stage_2023],
+                "new_2024currentrdstage": [stage_2024],
+                "_resolved_rdstage_2025": [stage_2025],
                 "new_includeinpipeline": [100000000],
                 "vin_product": ["Drugs"],
             }
         )
         result = _expand_temporal_rows(df)
-        assert len(result) == 1
+        assert list(result["new_currentrdstage"]) == expected_stages
 
     def test_rd_stage_column_sourced_correctly(self):
         """Each version carries the correct stage from its source year."""
@@ -238,12 +227,10 @@ class TestExpandTemporalRows:
             }
         )
         result = _expand_temporal_rows(df)
-        r2023 = result[result["valid_from"] == "2023-01-01"]
-        r2024 = result[result["valid_from"] == "2024-01-01"]
-        r2025 = result[result["valid_from"] == "2025-01-01"]
-        assert r2023["new_currentrdstage"].iloc[0] == "Discovery"
-        assert r2024["new_currentrdstage"].iloc[0] == "Preclinical"
-        assert r2025["new_currentrdstage"].iloc[0] == "Phase I"
+        stages = dict(zip(result["valid_from"], result["new_currentrdstage"]))
+        assert stages["2023-01-01"] == "Discovery"
+        assert stages["2024-01-01"] == "Preclinical"
+        assert stages["2025-01-01"] == "Phase I"
 
     def test_per_candidate_valid_to_consecutive_years(self):
         """Candidate with 2023, 2024, 2025: valid_to chains to next period."""
@@ -260,12 +247,14 @@ class TestExpandTemporalRows:
         )
         result = _expand_temporal_rows(df)
         result = result.sort_values("valid_from").reset_index(drop=True)
-        assert result.loc[0, "valid_from"] == "2023-01-01"
-        assert result.loc[0, "valid_to"] == "2024-01-01"
-        assert result.loc[1, "valid_from"] == "2024-01-01"
-        assert result.loc[1, "valid_to"] == "2025-01-01"
-        assert result.loc[2, "valid_from"] == "2025-01-01"
-        assert pd.isna(result.loc[2, "valid_to"])
+        expected = pd.DataFrame(
+            {
+                "valid_from": ["2023-01-01", "2024-01-01", "2025-01-01"],
+                "valid_to": ["2024-01-01", "2025-01-01", np.nan],
+            },
+            dtype=object,
+        )
+        pd.testing.assert_frame_equal(result[["valid_from", "valid_to"]], expected)
 
     def test_per_candidate_valid_to_with_gap(self):
         """Candidate with 2021 and 2024 (gap): valid_to jumps to next populated period.
@@ -289,12 +278,14 @@ class TestExpandTemporalRows:
         result = result.sort_values("valid_from").reset_index(drop=True)
         # 3 rows: rdstage {2021, 2024} ∪ pipeline {2025} = {2021, 2024, 2025}
         assert len(result) == 3
-        assert result.loc[0, "valid_from"] == "2021-01-01"
-        assert result.loc[0, "valid_to"] == "2024-01-01"
-        assert result.loc[1, "valid_from"] == "2024-01-01"
-        assert result.loc[1, "valid_to"] == "2025-01-01"
-        assert result.loc[2, "valid_from"] == "2025-01-01"
-        assert pd.isna(result.loc[2, "valid_to"])
+        expected = pd.DataFrame(
+            {
+                "valid_from": ["2021-01-01", "2024-01-01", "2025-01-01"],
+                "valid_to": ["2024-01-01", "2025-01-01", np.nan],
+            },
+            dtype=object,
+        )
+        pd.testing.assert_frame_equal(result[["valid_from", "valid_to"]], expected)
 
     def test_per_candidate_valid_to_single_year(self):
         """Candidate with only 2025: valid_to = None."""
@@ -327,7 +318,7 @@ class TestExpandTemporalRows:
             }
         )
         result = _expand_temporal_rows(df)
-        for col in [
+        dropped = {
             "vin_2019stagepcr",
             "new_2023currentrdstage",
             "new_2024currentrdstage",
@@ -336,25 +327,8 @@ class TestExpandTemporalRows:
             "new_includeinpipeline",
             "new_2024includeinpipeline",
             "new_includeinpipeline2021",
-        ]:
-            assert col not in result.columns
-
-    def test_null_year_produces_no_row(self):
-        """A year with null data in both groups produces no row for that year."""
-        df = pd.DataFrame(
-            {
-                "vin_candidateid": ["cand-1"],
-                "vin_name": ["CandA"],
-                "new_2023currentrdstage": ["Phase I"],
-                "new_2024currentrdstage": [None],
-                "_resolved_rdstage_2025": ["Phase III"],
-                "new_includeinpipeline": [100000000],
-                "vin_product": ["Drugs"],
-            }
-        )
-        result = _expand_temporal_rows(df)
-        # 2023 and 2025 have data -> 2 rows; 2024 is null -> no row
-        assert len(result) == 2
+        }
+        assert dropped.isdisjoint(result.columns)
 
     def test_multiple_candidates(self):
         """Multiple candidates each get their own SCD2 expansion."""
@@ -475,12 +449,12 @@ class TestExpandTemporalRows:
             }
         )
         result = _expand_temporal_rows(df)
-        for col in [
+        dropped = {
             "new_includeinpipeline",
             "new_2024includeinpipeline",
             "new_includeinpipeline2021",
-        ]:
-            assert col not in result.columns
+        }
+        assert dropped.isdisjoint(result.columns)
 
     def test_2019_pipeline_column_contributes_boundary(self):
         """2019-01-01 appears in valid_from when vin_2019pcrpipelineinclusion is set."""
@@ -641,148 +615,217 @@ class TestExpandTemporalRows:
         assert result.loc[3, "new_currentrdstage"] == "Phase II"
         assert result.loc[4, "new_currentrdstage"] == "Phase III"
 
+    def test_bronze_scd2_columns_overwritten_in_place(self):
+        """Bronze valid_from/valid_to are replaced by expansion, keeping position."""
+        df = pd.DataFrame(
+            {
+                "vin_candidateid": ["cand-1"],
+                "valid_from": ["2026-01-09"],
+                "valid_to": [None],
+                "vin_name": ["CandA"],
+                "new_2024currentrdstage": ["Phase I"],
+                "_resolved_rdstage_2025": ["Phase II"],
+            }
+        )
+        result = _expand_temporal_rows(df)
+        assert list(result.columns) == [
+            "vin_candidateid",
+            "valid_from",
+            "valid_to",
+            "vin_name",
+            "new_currentrdstage",
+            "includeinpipeline",
+        ]
+        assert list(result["valid_from"]) == ["2024-01-01", "2025-01-01"]
+
+
+def _build_input_df():
+    """Create a minimal input DataFrame mimicking vin_candidates (bronze columns)."""
+    data = {
+        # Columns that stay (original bronze names before rename)
+        "vin_name": ["Candidate A", "Candidate B", "Candidate C"],
+        "vin_product": ["Drug", "Diagnostic", "Reservoir targeted vaccines"],
+        "new_pressuretype": ["Negative pressure ", "Not applicable ", None],
+        # Temporal source columns (consumed by SCD2 expansion)
+        "vin_2019stagepcr": ["Phase I", None, None],
+        "new_2024currentrdstage": [
+            "Late development (design and development)",
+            "Phase III - Drugs",
+            "Discovery",
+        ],
+        "new_2023currentrdstage": ["Phase I", None, None],
+        # FK GUID column for 2025 RD stage (resolved via lookup_tables)
+        "_vin_currentrndstage_value": ["guid-1", "guid-2", None],
+        # Pipeline columns (temporal)
+        "vin_2019pcrpipelineinclusion": ["Yes", None, "Yes"],
+        "new_includeinpipeline2021": [100000000.0, 100000002.0, 100000001.0],
+        "new_2023includeinevgendatabase": ["Yes", "No", "Pending"],
+        "new_2024includeinpipeline": [862890000.0, None, None],
+        "new_includeinpipeline": [100000000.0, 100000002.0, 100000001.0],
+        "_vin_captype_value": [
+            "c1746ad3-93d1-f011-bbd3-00224892cefa",
+            "545d63d9-93d1-f011-bbd3-00224892cefa",
+            None,
+        ],
+        "vin_approvalstatus": [862890001.0, 909670000.0, None],
+        "vin_approvingauthority": [909670002.0, 909670001.0, None],
+        "new_indicationtype": [100000003.0, 100000000.0, None],
+        "vin_preclinicalresultsstatus": [909670004.0, 909670000.0, None],
+        "vin_candidateid": ["id-1", "id-2", "id-3"],
+        "modifiedon": ["2025-01-01", "2025-01-02", "2025-01-03"],
+        "statecode": [0, 0, 0],
+        # Columns to drop (metadata)
+        "row_id": [1, 2, 3],
+        "json_response": ['{"k":"v"}', '{"k":"v2"}', '{"k":"v3"}'],
+        "sync_time": ["2026-01-09", "2026-01-09", "2026-01-09"],
+        "_createdby_value": ["u1", "u2", "u3"],
+        "_modifiedby_value": ["m1", "m2", "m3"],
+        "_owninguser_value": ["o1", "o2", "o3"],
+        "_owningbusinessunit_value": ["b1", "b1", "b1"],
+        "statuscode": [1, 1, 1],
+        "importsequencenumber": [None, None, None],
+        "createdon": ["2024-01-01", "2024-01-02", "2024-01-03"],
+        # All-null columns
+        "valid_to_empty": [None, None, None],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="module")
+def make_input_df(frame_factory):
+    """Copies of the candidates input, with optional column overrides."""
+    return frame_factory(_build_input_df)
+
+
+def _build_lookup_tables():
+    """Create lookup_tables dict with vin_rdstageproducts."""
+    return {
+        "vin_rdstageproducts": pd.DataFrame(
+            {
+                "vin_rdstageproductid": ["guid-1", "guid-2"],
+                "vin_name": ["Phase II - Drugs", "Phase III - Vaccines"],
+            }
+        ),
+    }
+
 
-class TestTransformCandidates:
-    """Tests for transform_candidates function."""
+def _build_option_sets():
+    """Create option sets dict for candidates."""
+    return {
+        "_optionset_new_indicationtype": pd.DataFrame(
+            {
+                "code": [
+                    100000000,
+                    100000001,
+                    100000002,
+                    100000003,
+                    100000004,
+                    100000005,
+                ],
+                "label": [
+                    "Prevention",
+                    "Treatment",
+                    "Prevention & treatment",
+                    "Treatment",
+                    "Prevention",
+                    "Prevention & treatment",
+                ],
+                "first_seen": ["2026-01-09"] * 6,
+            }
+        ),
+        "_optionset_vin_preclinicalresultsstatus": pd.DataFrame(
+            {
+                "code": [909670000, 909670001, 909670002, 909670003, 909670004],
+                "label": [
+                    "Available",
+                    "Unavailable",
+                    "Unknown",
+                    "N/A",
+                    "Unavailable/unknown",
+                ],
+                "first_seen": ["2026-01-09"] * 5,
+            }
+        ),
+        "_optionset_vin_approvalstatus": pd.DataFrame(
+            {
+                "code": [
+                    862890001,
+                    862890002,
+                    909670000,
+                    909670002,
+                    909670003,
+                    909670004,
+                    909670005,
+                ],
+                "label": [
+                    "Adopted",
+                    "Used off-label",
+                    "Approved",
+                    "Approval withdrawn",
+                    "Emergency Use Authorisation",
+                    "Application under review",
+                    "Approval status unclear",
+                ],
+                "first_seen": ["2026-01-09"] * 7,
+            }
+        ),
+        "_optionset_vin_approvingauthority": pd.DataFrame(
+            {
+                "code": [909670000, 909670001, 909670002, 909670003],
+                "label": ["NRA", "SRA", "SRA Other", "WHO prequalification"],
+                "first_seen": ["2026-01-09"] * 4,
+            }
+        ),
+    }
 
-    def _make_input_df(self, overrides=None):
-        """Create a minimal input DataFrame mimicking vin_candidates (bronze columns)."""
-        data = {
-            # Columns that stay (original bronze names before rename)
-            "vin_name": ["Candidate A", "Candidate B", "Candidate C"],
-            "vin_product": ["Drug", "Diagnostic", "Reservoir targeted vaccines"],
-            "new_pressuretype": ["Negative pressure ", "Not applicable ", None],
-            # Temporal source columns (consumed by SCD2 expansion)
-            "vin_2019stagepcr": ["Phase I", None, None],
-            "new_2024currentrdstage": [
-                "Late development (design and development)",
-                "Phase III - Drugs",
-                "Discovery",
-            ],
-            "new_2023currentrdstage": ["Phase I", None, None],
-            # FK GUID column for 2025 RD stage (resolved via lookup_tables)
-            "_vin_currentrndstage_value": ["guid-1", "guid-2", None],
-            # Pipeline columns (temporal)
-            "vin_2019pcrpipelineinclusion": ["Yes", None, "Yes"],
-            "new_includeinpipeline2021": [100000000.0, 100000002.0, 100000001.0],
-            "new_2023includeinevgendatabase": ["Yes", "No", "Pending"],
-            "new_2024includeinpipeline": [862890000.0, None, None],
-            "new_includeinpipeline": [100000000.0, 100000002.0, 100000001.0],
-            "_vin_captype_value": [
-                "c1746ad3-93d1-f011-bbd3-00224892cefa",
-                "545d63d9-93d1-f011-bbd3-00224892cefa",
-                None,
-            ],
-            "vin_approvalstatus": [862890001.0, 909670000.0, None],
-            "vin_approvingauthority": [909670002.0, 909670001.0, None],
-            "new_indicationtype": [100000003.0, 100000000.0, None],
-            "vin_preclinicalresultsstatus": [909670004.0, 909670000.0, None],
-            "vin_candidateid": ["id-1", "id-2", "id-3"],
-            "modifiedon": ["2025-01-01", "2025-01-02", "2025-01-03"],
-            "statecode": [0, 0, 0],
-            # Columns to drop (metadata)
-            "row_id": [1, 2, 3],
-            "json_response": ['{"k":"v"}', '{"k":"v2"}', '{"k":"v3"}'],
-            "sync_time": ["2026-01-09", "2026-01-09", "2026-01-09"],
-            "_createdby_value": ["u1", "u2", "u3"],
-            "_modifiedby_value": ["m1", "m2", "m3"],
-            "_owninguser_value": ["o1", "o2", "o3"],
-            "_owningbusinessunit_value": ["b1", "b1", "b1"],
-            "statuscode": [1, 1, 1],
-            "importsequencenumber": [None, None, None],
-            "createdon": ["2024-01-01", "2024-01-02", "2024-01-03"],
-            # All-null columns
-            "valid_to_empty": [None, None, None],
-        }
-        if overrides:
-            data.update(overrides)
-        return pd.DataFrame(data)
-
-    def _make_lookup_tables(self):
-        """Create lookup_tables dict with vin_rdstageproducts."""
-        return {
-            "vin_rdstageproducts": pd.DataFrame(
-                {
-                    "vin_rdstageproductid": ["guid-1", "guid-2"],
-                    "vin_name": ["Phase II - Drugs", "Phase III - Vaccines"],
-                }
-            ),
-        }
 
-    def _make_option_sets(self):
-        """Create option sets dict for candidates."""
-        return {
-            "_optionset_new_indicationtype": pd.DataFrame(
-                {
-                    "code": [
-                        100000000,
-                        100000001,
-                        100000002,
-                        100000003,
-                        100000004,
-                        100000005,
-                    ],
-                    "label": [
-                        "Prevention",
-                        "Treatment",
-                        "Prevention & treatment",
-                        "Treatment",
-                        "Prevention",
-                        "Prevention & treatment",
-                    ],
-                    "first_seen": ["2026-01-09"] * 6,
-                }
-            ),
-            "_optionset_vin_preclinicalresultsstatus": pd.DataFrame(
-                {
-                    "code": [909670000, 909670001, 909670002, 909670003, 909670004],
-                    "label": [
-                        "Available",
-                        "Unavailable",
-                        "Unknown",
-                        "N/A",
-                        "Unavailable/unknown",
-                    ],
-                    "first_seen": ["2026-01-09"] * 5,
-                }
-            ),
-            "_optionset_vin_approvalstatus": pd.DataFrame(
-                {
-                    "code": [
-                        862890001,
-                        862890002,
-                        909670000,
-                        909670002,
-                        909670003,
-                        909670004,
-                        909670005,
-                    ],
-                    "label": [
-                        "Adopted",
-                        "Used off-label",
-                        "Approved",
-                        "Approval withdrawn",
-                        "Emergency Use Authorisation",
-                        "Application under review",
-                        "Approval status unclear",
-                    ],
-                    "first_seen": ["2026-01-09"] * 7,
-                }
-            ),
-            "_optionset_vin_approvingauthority": pd.DataFrame(
-                {
-                    "code": [909670000, 909670001, 909670002, 909670003],
-                    "label": ["NRA", "SRA", "SRA Other", "WHO prequalification"],
-                    "first_seen": ["2026-01-09"] * 4,
-                }
-            ),
-        }
+@pytest.fixture(scope="module")
+def make_lookup_tables(frame_factory):
+    """Copies of the lookup tables, built once per module."""
+    return frame_factory(_build_lookup_tables)
+
+
+@pytest.fixture(scope="module")
+def make_option_sets(frame_factory):
+    """Copies of the option sets, built once per module."""
+    return frame_factory(_build_option_sets)
+
+
+@pytest.fixture
+def lookup_tables(make_lookup_tables):
+    """Fresh lookup_tables dict for each test."""
+    return make_lookup_tables()
+
+
+@pytest.fixture
+def option_sets(make_option_sets):
+    """Fresh option_sets dict for each test."""
+    return make_option_sets()
+
+
+@pytest.fixture(scope="module")
+def transformed(make_input_df, make_lookup_tables, make_option_sets):
+    """transform_candidates output for the default input, shared read-only."""
+    return transform_candidates(
+        make_input_df(),
+        option_sets=make_option_sets(),
+        lookup_tables=make_lookup_tables(),
+    )
 
-    def test_drops_metadata_columns(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        for col in [
+
+@pytest.fixture(scope="module")
+def candidate_a(transformed):
+    """Rows of Candidate A from the shared default transform."""
+    result, _ = transformed
+    return result[result["candidate_name"] == "Candidate A"]
+
+
+class TestTransformCandidates:
+    """Tests for transform_candidates function."""
+
+    def test_drops_metadata_columns(self, transformed):
+        result, _ = transformed
+        dropped = {
             "row_id",
             "json_response",
             "sync_time",
@@ -793,75 +836,80 @@ class TestTransformCandidates:
             "statuscode",
             "importsequencenumber",
             "createdon",
-        ]:
-            assert col not in result.columns
-
-    def test_drops_empty_columns_preserving_valid_to(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        assert "valid_to" in result.columns
-        assert "valid_from" in result.columns
-
-    def test_standardizes_product_types(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        products = list(result["product"].unique())
-        assert "Drugs" in products
-        assert "Diagnostics" in products
-        assert "Vaccines" in products
-        assert "Drug" not in products
-        assert "Diagnostic" not in products
-        assert "Reservoir targeted vaccines" not in products
-
-    def test_standardizes_rd_stages_via_temporal_expansion(self):
+        }
+        assert dropped.isdisjoint(result.columns)
+
+    def test_drops_empty_columns_preserving_valid_to(self, transformed):
+        result, _ = transformed
+        assert {"valid_to", "valid_from"} <= set(result.columns)
+
+    def test_standardizes_product_types(self, transformed):
+        result, _ = transformed
+        products = set(result["product"].unique())
+        assert {"Drugs", "Diagnostics", "Vaccines"} <= products
+        assert not {"Drug", "Diagnostic", "Reservoir targeted vaccines"} & products
+
+    def test_standardizes_rd_stages_via_temporal_expansion(self, transformed):
         """RD stages are standardized on the new_currentrdstage column."""
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        stages = result["new_currentrdstage"].dropna().unique()
-        assert "Late development" in stages
-        assert "Phase III" in stages
-        assert "Discovery & Preclinical" in stages
-
-    def test_rd_stage_suffix_stripping(self):
+        result, _ = transformed
+        stages = set(result["new_currentrdstage"].dropna().unique())
+        assert {"Late development", "Phase III", "Discovery & Preclinical"} <= stages
+
+    def test_rd_stage_suffix_stripping(self, make_input_df, lookup_tables):
         """Remaining ' - ProductType' suffixes are stripped from new_currentrdstage."""
-        df = self._make_input_df(
+        df = make_input_df(
             overrides={
                 "new_2024currentrdstage": ["Phase I - Biologics", None, None],
                 "new_2023currentrdstage": [None, None, None],
                 "_vin_currentrndstage_value": [None, None, None],
             }
         )
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
         cand_a = result[result["candidate_name"] == "Candidate A"]
         stages = cand_a["new_currentrdstage"].dropna().tolist()
         for stage in stages:
             assert " - " not in stage
 
-    def test_standardizes_pressure_types(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        pressures = list(result["pressuretype"].dropna().unique())
-        assert "Negative pressure" in pressures
-        assert "N/A" in pressures
-        assert "Negative pressure " not in pressures
-        assert "Not applicable " not in pressures
-
-    def test_filters_by_includeinpipeline(self):
+    def test_standardizes_pressure_types(self, transformed):
+        result, _ = transformed
+        pressures = set(result["pressuretype"].dropna().unique())
+        assert {"Negative pressure", "N/A"} <= pressures
+        assert not {"Negative pressure ", "Not applicable "} & pressures
+
+    def test_pressure_types_trimmed_when_unmapped(self, make_input_df, lookup_tables):
+        """Surrounding whitespace is stripped from any pressure value."""
+        df = make_input_df(
+            overrides={
+                "new_pressuretype": ["Positive pressure  ", " Negative pressure", None],
+            }
+        )
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
+        pressures = set(result["pressuretype"].dropna())
+        assert pressures == {"Positive pressure", "Negative pressure"}
+
+    def test_categorical_label_columns_match_object_input(
+        self, make_input_df, lookup_tables, option_sets, transformed
+    ):
+        """Categorical label columns standardize exactly like object strings."""
+        label_cols = [
+            "vin_product",
+            "new_pressuretype",
+            "new_2023currentrdstage",
+            "new_2024currentrdstage",
+        ]
+        df = make_input_df().astype(dict.fromkeys(label_cols, "category"))
+        result, _ = transform_candidates(
+            df, option_sets=option_sets, lookup_tables=lookup_tables
+        )
+        pd.testing.assert_frame_equal(result, transformed[0])
+
+    def test_filters_by_includeinpipeline(self, transformed):
         """All candidates are kept; includeinpipeline has correct temporal values;
         include_in_pipeline boolean is derived correctly."""
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transformed
         # All 3 candidates should be present (no hard filtering)
-        candidate_names = result["candidate_name"].unique()
-        assert "Candidate A" in candidate_names
-        assert "Candidate B" in candidate_names
-        assert "Candidate C" in candidate_names
+        candidate_names = set(result["candidate_name"].unique())
+        assert candidate_names == {"Candidate A", "Candidate B", "Candidate C"}
         # includeinpipeline column should be present with temporal values
         assert "includeinpipeline" in result.columns
         # include_in_pipeline boolean should be derived
@@ -889,45 +937,41 @@ class TestTransformCandidates:
         ]
         assert (cand_c_cur["include_in_pipeline"] == 0).all()
 
-    def test_statecode_filters_deleted_records(self):
+    def test_statecode_filters_deleted_records(self, make_input_df, lookup_tables):
         """Records with statecode != 0 are excluded."""
-        df = self._make_input_df(overrides={"statecode": [0, 1, 0]})
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        df = make_input_df(overrides={"statecode": [0, 1, 0]})
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
         candidate_names = result["candidate_name"].unique()
         assert "Candidate A" in candidate_names
         assert "Candidate B" not in candidate_names
         assert "Candidate C" in candidate_names
 
-    def test_null_latest_pipeline_forward_fills_to_included(self):
+    def test_null_latest_pipeline_forward_fills_to_included(
+        self, make_input_df, lookup_tables
+    ):
         """Candidate with NULL new_includeinpipeline forward-fills from last known Yes value."""
-        df = self._make_input_df(
+        df = make_input_df(
             overrides={
                 "new_includeinpipeline": [None, 100000000.0, 100000001.0],
             }
         )
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
         cand_a_current = result[
             (result["candidate_name"] == "Candidate A") & (result["valid_to"].isna())
         ]
         # Last known value is 100000000 (2024), forward-filled through NULL 2025
         assert (cand_a_current["include_in_pipeline"] == 1).all()
 
-    def test_temporal_expansion_produces_new_currentrdstage(self):
+    def test_temporal_expansion_produces_new_currentrdstage(self, transformed):
         """Transform produces new_currentrdstage base column from SCD2 expansion."""
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transformed
         assert "new_currentrdstage" in result.columns
         assert len(result) >= 2
 
-    def test_temporal_source_columns_removed_after_transform(self):
+    def test_temporal_source_columns_removed_after_transform(self, transformed):
         """Year-specific temporal columns are consumed and not in final output."""
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        for col in [
+        result, _ = transformed
+        dropped = {
             "vin_2019stagepcr",
             "new_2023currentrdstage",
             "new_2024currentrdstage",
@@ -939,156 +983,114 @@ class TestTransformCandidates:
             "new_2023includeinevgendatabase",
             "new_2024includeinpipeline",
             "new_includeinpipeline",
-        ]:
-            assert col not in result.columns
+        }
+        assert dropped.isdisjoint(result.columns)
 
-    def test_captype_value_preserved(self):
+    def test_captype_value_preserved(self, transformed):
         """_vin_captype_value is renamed to captype_value and preserved."""
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transformed
         assert "captype_value" in result.columns
         assert "_vin_captype_value" not in result.columns
 
-    def test_renames_columns(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
-        assert "candidate_name" in result.columns
-        assert "vin_name" not in result.columns
-        assert "product" in result.columns
-        assert "vin_product" not in result.columns
+    def test_renames_columns(self, transformed):
+        result, _ = transformed
         # includeinpipeline is now produced by expansion, not rename
-        assert "includeinpipeline" in result.columns
-        assert "candidateid" in result.columns
+        renamed = {"candidate_name", "product", "includeinpipeline", "candidateid"}
+        assert renamed <= set(result.columns)
+        assert {"vin_name", "vin_product"}.isdisjoint(result.columns)
 
-    def test_approval_status_consolidation(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+    def test_approval_status_consolidation(self, candidate_a):
         # 862890001 (Adopted) -> 909670000 (Approved)
-        cand_a = result[result["candidate_name"] == "Candidate A"]
-        assert (cand_a["approvalstatus"] == 909670000).all()
+        assert candidate_a["approvalstatus"].eq(909670000).all()
 
-    def test_approving_authority_consolidation(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+    def test_approving_authority_consolidation(self, candidate_a):
         # 909670002 (SRA Other) -> 909670001 (SRA)
-        cand_a = result[result["candidate_name"] == "Candidate A"]
-        assert (cand_a["approvingauthority"] == 909670001).all()
+        assert candidate_a["approvingauthority"].eq(909670001).all()
 
-    def test_indication_type_consolidation(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+    def test_indication_type_consolidation(self, candidate_a):
         # 100000003 -> 100000001
-        cand_a = result[result["candidate_name"] == "Candidate A"]
-        assert (cand_a["indicationtype"] == 100000001).all()
+        assert candidate_a["indicationtype"].eq(100000001).all()
 
-    def test_preclinical_results_consolidation(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+    def test_preclinical_results_consolidation(self, candidate_a):
         # 909670004 -> 909670002
-        cand_a = result[result["candidate_name"] == "Candidate A"]
-        assert (cand_a["preclinicalresultsstatus"] == 909670002.0).all()
-
-    def test_option_set_dedup_indication_type(self):
-        df = self._make_input_df()
-        option_sets = self._make_option_sets()
-        lookup = self._make_lookup_tables()
-        _, cleaned = transform_candidates(
-            df, option_sets=option_sets, lookup_tables=lookup
-        )
+        assert candidate_a["preclinicalresultsstatus"].eq(909670002.0).all()
+
+    def test_option_set_dedup_indication_type(self, transformed):
+        _, cleaned = transformed
         assert "_optionset_new_indicationtype" in cleaned
         os_df = cleaned["_optionset_new_indicationtype"]
         assert len(os_df) == 3  # 6 -> 3 (remove duplicates at 100000003-5)
 
-    def test_option_set_dedup_preclinical_results(self):
-        df = self._make_input_df()
-        option_sets = self._make_option_sets()
-        lookup = self._make_lookup_tables()
-        _, cleaned = transform_candidates(
-            df, option_sets=option_sets, lookup_tables=lookup
-        )
+    def test_option_set_dedup_preclinical_results(self, transformed):
+        _, cleaned = transformed
         assert "_optionset_vin_preclinicalresultsstatus" in cleaned
         os_df = cleaned["_optionset_vin_preclinicalresultsstatus"]
         assert len(os_df) == 4  # 5 -> 4 (remove Unavailable/unknown)
 
-    def test_option_set_dedup_approval_status(self):
-        df = self._make_input_df()
-        option_sets = self._make_option_sets()
-        lookup = self._make_lookup_tables()
-        _, cleaned = transform_candidates(
-            df, option_sets=option_sets, lookup_tables=lookup
-        )
+    def test_option_set_dedup_approval_status(self, transformed):
+        _, cleaned = transformed
         assert "_optionset_vin_approvalstatus" in cleaned
         os_df = cleaned["_optionset_vin_approvalstatus"]
         assert len(os_df) == 6  # 7 -> 6 (remove Adopted)
 
-    def test_option_set_dedup_approving_authority(self):
-        df = self._make_input_df()
-        option_sets = self._make_option_sets()
-        lookup = self._make_lookup_tables()
-        _, cleaned = transform_candidates(
-            df, option_sets=option_sets, lookup_tables=lookup
-        )
+    def test_option_set_dedup_approving_authority(self, transformed):
+        _, cleaned = transformed
         assert "_optionset_vin_approvingauthority" in cleaned
         os_df = cleaned["_optionset_vin_approvingauthority"]
         assert len(os_df) == 3  # 4 -> 3 (remove SRA Other)
 
-    def test_returns_tuple(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
-        result, cleaned = transform_candidates(df, lookup_tables=lookup)
+    def test_returns_tuple(self, transformed):
+        result, cleaned = transformed
         assert isinstance(result, pd.DataFrame)
         assert isinstance(cleaned, dict)
 
-    def test_does_not_modify_original(self):
-        df = self._make_input_df()
-        original_columns = list(df.columns)
-        lookup = self._make_lookup_tables()
-        transform_candidates(df, lookup_tables=lookup)
-        assert list(df.columns) == original_columns
-
-    def test_works_when_option_sets_is_none(self):
-        df = self._make_input_df()
-        lookup = self._make_lookup_tables()
+    def test_does_not_modify_original(self, make_input_df, lookup_tables, option_sets):
+        df = make_input_df()
+        expected = df.copy()
+        expected_lookups = {k: v.copy() for k, v in lookup_tables.items()}
+        expected_option_sets = {k: v.copy() for k, v in option_sets.items()}
+        transform_candidates(df, option_sets=option_sets, lookup_tables=lookup_tables)
+        pd.testing.assert_frame_equal(df, expected)
+        for name, frame in expected_lookups.items():
+            pd.testing.assert_frame_equal(lookup_tables[name], frame)
+        for name, frame in expected_option_sets.items():
+            pd.testing.assert_frame_equal(option_sets[name], frame)
+
+    def test_works_when_option_sets_is_none(self, make_input_df, lookup_tables):
+        df = make_input_df()
         result, cleaned = transform_candidates(
-            df, option_sets=None, lookup_tables=lookup
+            df, option_sets=None, lookup_tables=lookup_tables
         )
         assert isinstance(result, pd.DataFrame)
         assert len(cleaned) == 0
 
-    def test_works_without_lookup_tables(self):
+    def test_works_without_lookup_tables(self, make_input_df):
         """Transform still works when lookup_tables is None (no FK resolution)."""
-        df = self._make_input_df()
+        df = make_input_df()
         result, cleaned = transform_candidates(df, lookup_tables=None)
         assert isinstance(result, pd.DataFrame)
         # _vin_currentrndstage_value should be dropped (consumed by expansion)
         assert "_vin_currentrndstage_value" not in result.columns
 
-    def test_new_columns_not_dropped(self):
+    def test_new_columns_not_dropped(self, make_input_df, lookup_tables):
         """routeofadministration, new_platform, chimstudyyesno survive transform."""
-        df = self._make_input_df(
+        df = make_input_df(
             overrides={
                 "vin_routeofadministrationaggregated": ["Oral", "IV", None],
                 "new_platform": ["mRNA", None, "Protein"],
                 "new_chimstudyyesno": [100000000, None, 100000001],
             }
         )
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
         # Renamed columns present
         assert "routeofadministration" in result.columns
         assert "chimstudyyesno" in result.columns
         # new_platform keeps its name (no prefix to strip)
         assert "new_platform" in result.columns
 
-    def test_ctregistrylink_synthesis_applied(self):
+    def test_ctregistrylink_synthesis_applied(self, make_input_df, lookup_tables):
         """CT registry link is cleaned during transform."""
-        df = self._make_input_df(
+        df = make_input_df(
             overrides={
                 "new_ctregistrylink": [
                     "https://clinicaltrials.gov/study/NCT001",
@@ -1097,8 +1099,7 @@ class TestTransformCandidates:
                 ],
             }
         )
-        lookup = self._make_lookup_tables()
-        result, _ = transform_candidates(df, lookup_tables=lookup)
+        result, _ = transform_candidates(df, lookup_tables=lookup_tables)
         ct_values = result.groupby("candidate_name")["ctregistrylink"].first()
         assert ct_values["Candidate A"] == "https://clinicaltrials.gov/study/NCT001"
         assert (
@@ -1,6 +1,8 @@
 """Tests for data cleanup transformation utilities."""
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from igh_data_transform.transformations.cleanup import (
     drop_columns_by_name,
@@ -38,37 +40,26 @@ class TestDropColumnsByName:
 class TestDropEmptyColumns:
     """Tests for drop_empty_columns function."""
 
-    def test_drops_all_null_columns(self):
-        df = pd.DataFrame(
+    @pytest.fixture
+    def mixed_df(self) -> pd.DataFrame:
+        """Full, all-null and partially null columns side by side."""
+        return pd.DataFrame(
             {
                 "a": [1, 2, 3],
                 "b": [None, None, None],
                 "c": ["x", "y", "z"],
-            }
-        )
-        result = drop_empty_columns(df)
-        assert list(result.columns) == ["a", "c"]
-
-    def test_preserves_specified_columns(self):
-        df = pd.DataFrame(
-            {
-                "a": [1, 2, 3],
+                "d": [1, None, 3],
                 "valid_to": [None, None, None],
             }
         )
-        result = drop_empty_columns(df, preserve=["valid_to"])
-        assert "valid_to" in result.columns
 
-    def test_keeps_partial_null_columns(self):
-        df = pd.DataFrame(
-            {
-                "a": [1, None, 3],
-                "b": [None, None, None],
-            }
-        )
-        result = drop_empty_columns(df)
-        assert "a" in result.columns
-        assert "b" not in result.columns
+    def test_drops_only_all_null_columns(self, mixed_df):
+        result = drop_empty_columns(mixed_df)
+        assert list(result.columns) == ["a", "c", "d"]
+
+    def test_preserves_specified_columns(self, mixed_df):
+        result = drop_empty_columns(mixed_df, preserve=["valid_to"])
+        assert list(result.columns) == ["a", "c", "d", "valid_to"]
 
     def test_empty_dataframe(self):
         df = pd.DataFrame()
@@ -109,32 +100,27 @@ class TestRenameColumns:
 class TestNormalizeWhitespace:
     """Tests for normalize_whitespace function."""
 
-    def test_strips_whitespace(self):
-        assert normalize_whitespace("  hello  ") == "hello"
-
-    def test_collapses_multiple_spaces(self):
-        assert normalize_whitespace("hello    world") == "hello world"
-
-    def test_removes_html_br(self):
-        assert normalize_whitespace("line1<br>line2") == "line1 line2"
-        assert normalize_whitespace("line1<BR>line2") == "line1 line2"
-
-    def test_normalizes_unicode_space(self):
-        assert normalize_whitespace("hello\xa0world") == "hello world"
-
-    def test_returns_none_for_none(self):
-        assert normalize_whitespace(None) is None
-
-    def test_returns_none_for_empty_string(self):
-        assert normalize_whitespace("   ") is None
+    @pytest.mark.parametrize(
+        "input_val,expected",
+        [
+            ("  hello  ", "hello"),
+            ("hello    world", "hello world"),
+            ("line1<br>line2", "line1 line2"),
+            ("line1<BR>line2", "line1 line2"),
+            ("hello\xa0world", "hello world"),
+        ],
+    )
+    def test_normalizes_text(self, input_val, expected):
+        assert normalize_whitespace(input_val) == expected
+
+    @pytest.mark.parametrize("input_val", [None, "   ", np.nan])
+    def test_returns_none_for_missing(self, input_val):
+        assert normalize_whitespace(input_val) is None
 
     def test_preserves_html_when_disabled(self):
         result = normalize_whitespace("a<br>b", remove_html=False)
         assert result == "a<br>b"
 
-    def test_handles_nan(self):
-        assert normalize_whitespace(float("nan")) is None
-
 
 class TestReplaceValues:
     """Tests for replace_values function."""
@@ -142,24 +128,25 @@ class TestReplaceValues:
     def test_replaces_values(self):
         df = pd.DataFrame({"status": ["Active", "Inactive", "Active"]})
         result = replace_values(df, "status", {"Active": "A", "Inactive": "I"})
-        assert list(result["status"]) == ["A", "I", "A"]
+        np.testing.assert_array_equal(result["status"].to_numpy(), ["A", "I", "A"])
 
     def test_preserves_unmapped_values(self):
         df = pd.DataFrame({"col": ["a", "b", "c"]})
         result = replace_values(df, "col", {"a": "x"})
-        assert list(result["col"]) == ["x", "b", "c"]
+        np.testing.assert_array_equal(result["col"].to_numpy(), ["x", "b", "c"])
 
     def test_does_not_modify_original(self):
         df = pd.DataFrame({"col": ["a", "b"]})
         replace_values(df, "col", {"a": "x"})
-        assert list(df["col"]) == ["a", "b"]
+        np.testing.assert_array_equal(df["col"].to_numpy(), ["a", "b"])
 
     def test_numeric_replacement(self):
         df = pd.DataFrame({"code": [100, 200, 100]})
         result = replace_values(df, "code", {100: 1, 200: 2})
-        assert list(result["code"]) == [1, 2, 1]
+        np.testing.assert_array_equal(result["code"].to_numpy(), [1, 2, 1])
+        assert result["code"].dtype == np.int64
 
     def test_empty_mapping(self):
         df = pd.DataFrame({"col": ["a", "b"]})
         result = replace_values(df, "col", {})
-        assert list(result["col"]) == ["a", "b"]
+        np.testing.assert_array_equal(result["col"].to_numpy(), ["a", "b"])
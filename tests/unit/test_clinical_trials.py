@@ -5,6 +5,9 @@ import pandas as pd
 import pytest
 
 from igh_data_transform.transformations.clinical_trials import (
+    _PHASE_EXACT,
+    _classify_distinct,
+    _classify_phase_token,
     _clean_study_types,
     _synthesize_age_groups,
     _synthesize_gender,
@@ -19,123 +22,65 @@ class TestSynthesizePhase:
     @pytest.mark.parametrize(
         "input_val,expected",
         [
-            ("Phase I", "Phase I"),
-            ("PHASE 1", "Phase I"),
-            ("1", "Phase I"),
-            ("I", "Phase I"),
-            ("EARLY_PHASE1", "Phase I"),
-            ("PHASE1", "Phase I"),
-        ],
-    )
-    def test_phase_i(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase II", "Phase II"),
-            ("PHASE 2", "Phase II"),
-            ("2", "Phase II"),
-            ("II", "Phase II"),
-            ("PHASR II", "Phase II"),
-            ("PHASE2", "Phase II"),
-        ],
-    )
-    def test_phase_ii(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase III", "Phase III"),
-            ("PHASE 3", "Phase III"),
-            ("3", "Phase III"),
-            ("III", "Phase III"),
-            ("PHASE3", "Phase III"),
-        ],
-    )
-    def test_phase_iii(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase IV", "Phase IV"),
-            ("PHASE 4", "Phase IV"),
-            ("4", "Phase IV"),
-            ("POST-MARKET", "Phase IV"),
-            ("POST MARKETING", "Phase IV"),
-        ],
-    )
-    def test_phase_iv(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase I/II", "Phase I/II"),
-            ("1/2", "Phase I/II"),
-            ("1 AND 2", "Phase I/II"),
-            ("PHASE1|PHASE2", "Phase I/II"),
-        ],
-    )
-    def test_combined_i_ii(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase II/III", "Phase II/III"),
-            ("2/3", "Phase II/III"),
-            ("PHASE2|PHASE3", "Phase II/III"),
-        ],
-    )
-    def test_combined_ii_iii(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Phase III/IV", "Phase III/IV"),
-            ("3/4", "Phase III/IV"),
-        ],
-    )
-    def test_combined_iii_iv(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("Observational", "Observational"),
-            ("CHIM", "CHIM"),
-            ("Retrospective", "Retrospective"),
-        ],
-    )
-    def test_special_types_preserved(self, input_val, expected):
-        assert _synthesize_phase(input_val) == expected
-
-    @pytest.mark.parametrize(
-        "input_val,expected",
-        [
-            ("N/A", "N/A"),
-            ("NOT APPLICABLE", "N/A"),
-            ("Not Applicable", "N/A"),
-            ("NA", "N/A"),
-            ("0", "N/A"),
-            ("PHASE 0", "N/A"),
+            pytest.param("Phase I", "Phase I", id="phase_i/Phase I"),
+            pytest.param("PHASE 1", "Phase I", id="phase_i/PHASE 1"),
+            pytest.param("1", "Phase I", id="phase_i/1"),
+            pytest.param("I", "Phase I", id="phase_i/I"),
+            pytest.param("EARLY_PHASE1", "Phase I", id="phase_i/EARLY_PHASE1"),
+            pytest.param("PHASE1", "Phase I", id="phase_i/PHASE1"),
+            pytest.param("Phase II", "Phase II", id="phase_ii/Phase II"),
+            pytest.param("PHASE 2", "Phase II", id="phase_ii/PHASE 2"),
+            pytest.param("2", "Phase II", id="phase_ii/2"),
+            pytest.param("II", "Phase II", id="phase_ii/II"),
+            pytest.param("PHASR II", "Phase II", id="phase_ii/PHASR II"),
+            pytest.param("PHASE2", "Phase II", id="phase_ii/PHASE2"),
+            pytest.param("Phase III", "Phase III", id="phase_iii/Phase III"),
+            pytest.param("PHASE 3", "Phase III", id="phase_iii/PHASE 3"),
+            pytest.param("3", "Phase III", id="phase_iii/3"),
+            pytest.param("III", "Phase III", id="phase_iii/III"),
+            pytest.param("PHASE3", "Phase III", id="phase_iii/PHASE3"),
+            pytest.param("Phase IV", "Phase IV", id="phase_iv/Phase IV"),
+            pytest.param("PHASE 4", "Phase IV", id="phase_iv/PHASE 4"),
+            pytest.param("4", "Phase IV", id="phase_iv/4"),
+            pytest.param("POST-MARKET", "Phase IV", id="phase_iv/POST-MARKET"),
+            pytest.param("POST MARKETING", "Phase IV", id="phase_iv/POST MARKETING"),
+            pytest.param("Phase I/II", "Phase I/II", id="combined_i_ii/Phase I/II"),
+            pytest.param("1/2", "Phase I/II", id="combined_i_ii/1/2"),
+            pytest.param("1 AND 2", "Phase I/II", id="combined_i_ii/1 AND 2"),
+            pytest.param(
+                "PHASE1|PHASE2", "Phase I/II", id="combined_i_ii/PHASE1|PHASE2"
+            ),
+            pytest.param(
+                "Phase II/III", "Phase II/III", id="combined_ii_iii/Phase II/III"
+            ),
+            pytest.param("2/3", "Phase II/III", id="combined_ii_iii/2/3"),
+            pytest.param(
+                "PHASE2|PHASE3", "Phase II/III", id="combined_ii_iii/PHASE2|PHASE3"
+            ),
+            pytest.param(
+                "Phase III/IV", "Phase III/IV", id="combined_iii_iv/Phase III/IV"
+            ),
+            pytest.param("3/4", "Phase III/IV", id="combined_iii_iv/3/4"),
+            pytest.param("Observational", "Observational", id="special/Observational"),
+            pytest.param("CHIM", "CHIM", id="special/CHIM"),
+            pytest.param("Retrospective", "Retrospective", id="special/Retrospective"),
+            pytest.param("N/A", "N/A", id="na/N/A"),
+            pytest.param("NOT APPLICABLE", "N/A", id="na/NOT APPLICABLE"),
+            pytest.param("Not Applicable", "N/A", id="na/Not Applicable"),
+            pytest.param("NA", "N/A", id="na/NA"),
+            pytest.param("0", "N/A", id="na/0"),
+            pytest.param("PHASE 0", "N/A", id="na/PHASE 0"),
+            pytest.param(None, "Unknown", id="unknown/None"),
+            pytest.param(np.nan, "Unknown", id="unknown/nan"),
+            pytest.param("something weird", "Unknown", id="unknown/unrecognized"),
         ],
     )
-    def test_na_values(self, input_val, expected):
+    def test_phase(self, input_val, expected):
         assert _synthesize_phase(input_val) == expected
 
-    def test_none_returns_unknown(self):
-        assert _synthesize_phase(None) == "Unknown"
-
-    def test_nan_returns_unknown(self):
-        assert _synthesize_phase(float("nan")) == "Unknown"
-
-    def test_unrecognized_returns_unknown(self):
-        assert _synthesize_phase("something weird") == "Unknown"
+    @pytest.mark.parametrize("token,label", sorted(_PHASE_EXACT.items()))
+    def test_exact_table_agrees_with_ordered_checks(self, token, label):
+        assert _classify_phase_token(token) == label
 
 
 class TestSynthesizeAgeGroups:
@@ -199,11 +144,15 @@ class TestSynthesizeAgeGroups:
     def test_neonates(self):
         assert _synthesize_age_groups("Neonate") == "Neonates"
 
+    @pytest.mark.parametrize("input_val", [17, 17.0, "17"])
+    def test_non_string_values_classified_by_text(self, input_val):
+        assert _synthesize_age_groups(input_val) == "Adolescents"
+
     def test_none_returns_unknown(self):
         assert _synthesize_age_groups(None) == "Unknown"
 
     def test_nan_returns_unknown(self):
-        assert _synthesize_age_groups(float("nan")) == "Unknown"
+        assert _synthesize_age_groups(np.nan) == "Unknown"
 
     def test_unrecognized_returns_unknown(self):
         assert _synthesize_age_groups("something weird") == "Unknown"
@@ -259,7 +208,14 @@ class TestSynthesizeGender:
         assert _synthesize_gender(None) == "Unknown"
 
     def test_nan_returns_unknown(self):
-        assert _synthesize_gender(float("nan")) == "Unknown"
+        assert _synthesize_gender(np.nan) == "Unknown"
+
+    @pytest.mark.parametrize(
+        "input_val,expected",
+        [("Female", "Female"), (None, "Unknown"), (np.nan, "Unknown")],
+    )
+    def test_repeated_calls_are_stable(self, input_val, expected):
+        assert [_synthesize_gender(input_val) for _ in range(3)] == [expected] * 3
 
 
 class TestCleanStudyTypes:
@@ -296,139 +252,193 @@ class TestCleanStudyTypes:
         assert _clean_study_types(None) is None
 
     def test_nan_returns_nan(self):
-        result = _clean_study_types(float("nan"))
+        result = _clean_study_types(np.nan)
         assert result is None or (isinstance(result, float) and np.isnan(result))
 
 
+class TestClassifyDistinct:
+    """Tests for _classify_distinct helper."""
+
+    def test_classifies_each_distinct_value_once(self):
+        calls = []
+
+        def classify(val):
+            calls.append(val)
+            return "Unknown" if pd.isna(val) else val.upper()
+
+        series = pd.Series(
+            ["a", "b", "a", None, "b", np.nan], index=[5, 4, 3, 2, 1, 0], dtype=object
+        )
+        result = _classify_distinct(series, classify)
+        assert list(result) == ["A", "B", "A", "Unknown", "B", "Unknown"]
+        assert list(result.index) == [5, 4, 3, 2, 1, 0]
+        # One call per distinct value; None and NaN are separate nulls
+        assert len(calls) == 4
+        assert {"a", "b"} < set(calls)
+
+    def test_mixed_types_match_rowwise_apply(self):
+        values = [1, 1.0, True, "1", None, np.nan, 1, "1"]
+        series = pd.Series(values, dtype=object)
+        result = _classify_distinct(series, repr)
+        assert list(result) == [repr(v) for v in values]
+
+    def test_study_type_nulls_keep_their_own_value(self):
+        series = pd.Series(["Interventional", np.nan, None], dtype=object)
+        result = _classify_distinct(series, _clean_study_types)
+        pd.testing.assert_series_equal(result, series.apply(_clean_study_types))
+
+    def test_empty_series(self):
+        result = _classify_distinct(pd.Series([], dtype=object), _synthesize_phase)
+        assert result.empty
+
+
+def _build_input_df():
+    """Create a minimal input DataFrame mimicking vin_clinicaltrials."""
+    data = {
+        "row_id": [1, 2],
+        "new_studydesign": ["Design A", "Design B"],
+        "new_collaborator": [None, "Collab"],
+        "new_studydocuments": [None, None],
+        "new_test": [None, None],
+        "vin_ctphase": ["Phase I", "2"],
+        "vin_ctid": [4506, 4498],
+        "new_sponsor": ["Sponsor A", "Sponsor B"],
+        "new_fundertype": [None, None],
+        "new_aim1ctlastupdated": [None, None],
+        "modifiedon": ["2025-01-01", "2025-01-02"],
+        "importsequencenumber": [None, None],
+        "vin_ctterminatedreason": [None, None],
+        "vin_clinicaltrialid": ["ct-1", "ct-2"],
+        "new_locations": ["USA", "UK"],
+        "statecode": [0, 0],
+        "_vin_candidate_value": ["cand-1", "cand-2"],
+        "new_firstposted": ["2024-01-01", "2024-02-01"],
+        "createdon": ["2024-01-01", "2024-02-01"],
+        "new_aim1ctnumber": [None, None],
+        "new_outcomemeasure_secondary": [None, None],
+        "vin_ctresultstype": [None, None],
+        "vin_title": ["Title A", "Title B"],
+        "vin_enddate": ["2025-12-31", None],
+        "new_includedaim1": [None, None],
+        "_ownerid_value": ["owner-1", "owner-2"],
+        "new_aim1listsctid": [None, None],
+        "_modifiedby_value": ["mod-1", "mod-2"],
+        "new_outcomemeasure_primary": ["Primary", None],
+        "new_aim1ctstatus": [None, None],
+        "new_interventions": ["Drug", None],
+        "vin_ctresultsstatus": [None, None],
+        "vin_ctenrolment": [100, 200],
+        "vin_endtype": [None, None],
+        "new_aim1pcrreviewnotes": [None, None],
+        "new_age": ["Adult", "65 Years"],
+        "vin_startdate": ["2024-01-01", "2024-02-01"],
+        "new_sex": ["Both", "Female"],
+        "new_pipsct": [None, None],
+        "_createdby_value": ["cr-1", "cr-2"],
+        "vin_ctrialid": ["trial-1", "trial-2"],
+        "new_conditions": ["Malaria", "TB"],
+        "vin_starttype": [None, None],
+        "vin_pcrreviewcomments": [None, None],
+        "_owningbusinessunit_value": ["bu-1", "bu-1"],
+        "vin_description": ["Desc A", "Desc B"],
+        "new_indicationtype": [100000000, 100000001],
+        "vin_ctterminatedtype": [None, None],
+        "vin_ctresultssource": [None, None],
+        "vin_source": ["ClinicalTrials.gov", "WHO ICTRP"],
+        "new_resultsfirstposted": [None, None],
+        "versionnumber": [100, 200],
+        "new_primarycompletiondate": [
+            "2024-10-28T13:00:00Z",
+            "2025-12-31T13:00:00Z",
+        ],
+        "new_primaryoutcomemeasures": [None, None],
+        "timezoneruleversionnumber": [0.0, None],
+        "vin_recentupdates": [None, None],
+        "vin_name": ["CT-001", "CT-002"],
+        "new_studytype": ["INTERVENTIONAL", "Observational Study"],
+        "vin_lastupdated": [None, None],
+        "new_secondaryoutcomemeasures": [None, None],
+        "_owninguser_value": ["user-1", "user-2"],
+        "vin_ctstatus": [100000002.0, 909670002.0],
+        "statuscode": [1, 1],
+        "json_response": ['{"k":"v"}', '{"k":"v2"}'],
+        "sync_time": ["2026-01-09", "2026-01-09"],
+        "valid_from": ["2024-01-01", "2024-02-01"],
+        "valid_to": [None, None],
+        # Empty columns
+        "_createdonbehalfby_value": [None, None],
+        "overriddencreatedon": [None, None],
+        "_modifiedonbehalfby_value": [None, None],
+        "utcconversiontimezonecode": [None, None],
+        "_owningteam_value": [None, None],
+    }
+    return pd.DataFrame(data)
+
+
+@pytest.fixture(scope="module")
+def make_input_df(frame_factory):
+    """Copies of the vin_clinicaltrials input, with optional column overrides."""
+    return frame_factory(_build_input_df)
+
+
+def _build_option_sets():
+    """Create option set dict with vin_ctstatus."""
+    return {
+        "_optionset_vin_ctstatus": pd.DataFrame(
+            {
+                "code": [
+                    100000001,
+                    100000002,
+                    100000003,
+                    100000004,
+                    100000005,
+                    100000006,
+                    909670000,
+                    909670001,
+                    909670002,
+                    909670003,
+                    909670004,
+                    909670006,
+                    909670007,
+                ],
+                "label": [
+                    "Planned",
+                    "Recruiting",
+                    "Not yet recruiting",
+                    "Active, not recruiting",
+                    "Enrolling by invitation",
+                    "Not Recruiting",
+                    "Terminated",
+                    "Active",
+                    "Completed",
+                    "Results submitted",
+                    "Suspended",
+                    "Withdrawn",
+                    "Unknown",
+                ],
+                "first_seen": ["2026-01-09"] * 13,
+            }
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def make_option_sets(frame_factory):
+    """Copies of the ctstatus option set, built once per module."""
+    return frame_factory(_build_option_sets)
+
+
+@pytest.fixture
+def option_sets(make_option_sets):
+    """Fresh option_sets dict for each test."""
+    return make_option_sets()
+
+
 class TestTransformClinicalTrials:
     """Tests for transform_clinical_trials orchestrator."""
 
-    def _make_input_df(self, overrides=None):
-        """Create a minimal input DataFrame mimicking vin_clinicaltrials."""
-        data = {
-            "row_id": [1, 2],
-            "new_studydesign": ["Design A", "Design B"],
-            "new_collaborator": [None, "Collab"],
-            "new_studydocuments": [None, None],
-            "new_test": [None, None],
-            "vin_ctphase": ["Phase I", "2"],
-            "vin_ctid": [4506, 4498],
-            "new_sponsor": ["Sponsor A", "Sponsor B"],
-            "new_fundertype": [None, None],
-            "new_aim1ctlastupdated": [None, None],
-            "modifiedon": ["2025-01-01", "2025-01-02"],
-            "importsequencenumber": [None, None],
-            "vin_ctterminatedreason": [None, None],
-            "vin_clinicaltrialid": ["ct-1", "ct-2"],
-            "new_locations": ["USA", "UK"],
-            "statecode": [0, 0],
-            "_vin_candidate_value": ["cand-1", "cand-2"],
-            "new_firstposted": ["2024-01-01", "2024-02-01"],
-            "createdon": ["2024-01-01", "2024-02-01"],
-            "new_aim1ctnumber": [None, None],
-            "new_outcomemeasure_secondary": [None, None],
-            "vin_ctresultstype": [None, None],
-            "vin_title": ["Title A", "Title B"],
-            "vin_enddate": ["2025-12-31", None],
-            "new_includedaim1": [None, None],
-            "_ownerid_value": ["owner-1", "owner-2"],
-            "new_aim1listsctid": [None, None],
-            "_modifiedby_value": ["mod-1", "mod-2"],
-            "new_outcomemeasure_primary": ["Primary", None],
-            "new_aim1ctstatus": [None, None],
-            "new_interventions": ["Drug", None],
-            "vin_ctresultsstatus": [None, None],
-            "vin_ctenrolment": [100, 200],
-            "vin_endtype": [None, None],
-            "new_aim1pcrreviewnotes": [None, None],
-            "new_age": ["Adult", "65 Years"],
-            "vin_startdate": ["2024-01-01", "2024-02-01"],
-            "new_sex": ["Both", "Female"],
-            "new_pipsct": [None, None],
-            "_createdby_value": ["cr-1", "cr-2"],
-            "vin_ctrialid": ["trial-1", "trial-2"],
-            "new_conditions": ["Malaria", "TB"],
-            "vin_starttype": [None, None],
-            "vin_pcrreviewcomments": [None, None],
-            "_owningbusinessunit_value": ["bu-1", "bu-1"],
-            "vin_description": ["Desc A", "Desc B"],
-            "new_indicationtype": [100000000, 100000001],
-            "vin_ctterminatedtype": [None, None],
-            "vin_ctresultssource": [None, None],
-            "vin_source": ["ClinicalTrials.gov", "WHO ICTRP"],
-            "new_resultsfirstposted": [None, None],
-            "versionnumber": [100, 200],
-            "new_primarycompletiondate": [
-                "2024-10-28T13:00:00Z",
-                "2025-12-31T13:00:00Z",
-            ],
-            "new_primaryoutcomemeasures": [None, None],
-            "timezoneruleversionnumber": [0.0, None],
-            "vin_recentupdates": [None, None],
-            "vin_name": ["CT-001", "CT-002"],
-            "new_studytype": ["INTERVENTIONAL", "Observational Study"],
-            "vin_lastupdated": [None, None],
-            "new_secondaryoutcomemeasures": [None, None],
-            "_owninguser_value": ["user-1", "user-2"],
-            "vin_ctstatus": [100000002.0, 909670002.0],
-            "statuscode": [1, 1],
-            "json_response": ['{"k":"v"}', '{"k":"v2"}'],
-            "sync_time": ["2026-01-09", "2026-01-09"],
-            "valid_from": ["2024-01-01", "2024-02-01"],
-            "valid_to": [None, None],
-            # Empty columns
-            "_createdonbehalfby_value": [None, None],
-            "overriddencreatedon": [None, None],
-            "_modifiedonbehalfby_value": [None, None],
-            "utcconversiontimezonecode": [None, None],
-            "_owningteam_value": [None, None],
-        }
-        if overrides:
-            data.update(overrides)
-        return pd.DataFrame(data)
-
-    def _make_option_sets(self):
-        """Create option set dict with vin_ctstatus."""
-        return {
-            "_optionset_vin_ctstatus": pd.DataFrame(
-                {
-                    "code": [
-                        100000001,
-                        100000002,
-                        100000003,
-                        100000004,
-                        100000005,
-                        100000006,
-                        909670000,
-                        909670001,
-                        909670002,
-                        909670003,
-                        909670004,
-                        909670006,
-                        909670007,
-                    ],
-                    "label": [
-                        "Planned",
-                        "Recruiting",
-                        "Not yet recruiting",
-                        "Active, not recruiting",
-                        "Enrolling by invitation",
-                        "Not Recruiting",
-                        "Terminated",
-                        "Active",
-                        "Completed",
-                        "Results submitted",
-                        "Suspended",
-                        "Withdrawn",
-                        "Unknown",
-                    ],
-                    "first_seen": ["2026-01-09"] * 13,
-                }
-            ),
-        }
-
-    def test_drops_metadata_and_aim1_columns(self):
-        df = self._make_input_df()
+    def test_drops_metadata_and_aim1_columns(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         dropped = [
             "new_aim1ctlastupdated",
@@ -457,49 +467,48 @@ class TestTransformClinicalTrials:
         for col in dropped:
             assert col not in result.columns
 
-    def test_renames_primary_completion_date(self):
-        df = self._make_input_df()
+    def test_renames_primary_completion_date(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert "primarycompletiondate" in result.columns
         assert "new_primarycompletiondate" not in result.columns
 
-    def test_drops_empty_columns_preserving_valid_to(self):
-        df = self._make_input_df()
+    def test_drops_empty_columns_preserving_valid_to(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert "valid_to" in result.columns
         assert "_createdonbehalfby_value" not in result.columns
 
-    def test_applies_phase_synthesis(self):
-        df = self._make_input_df()
+    def test_applies_phase_synthesis(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert list(result["ctphase"]) == ["Phase I", "Phase II"]
 
-    def test_applies_age_group_synthesis(self):
-        df = self._make_input_df()
+    def test_applies_age_group_synthesis(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert list(result["age"]) == ["Young Adults 18 - 45", "Older adults: 45 >"]
 
-    def test_applies_gender_synthesis(self):
-        df = self._make_input_df()
+    def test_applies_gender_synthesis(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert list(result["sex"]) == ["Both", "Female"]
 
-    def test_applies_study_type_normalization(self):
-        df = self._make_input_df()
+    def test_applies_study_type_normalization(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert list(result["studytype"]) == ["Interventional", "Observational"]
 
-    def test_ct_status_value_consolidation(self):
-        df = self._make_input_df({"vin_ctstatus": [100000002.0, 909670002.0]})
+    def test_ct_status_value_consolidation(self, make_input_df):
+        df = make_input_df({"vin_ctstatus": [100000002.0, 909670002.0]})
         result, _ = transform_clinical_trials(df)
         # 100000002 (Recruiting) -> 909670001 (Active)
         assert result["ctstatus"].iloc[0] == 909670001
         # 909670002 (Completed) -> unchanged
         assert result["ctstatus"].iloc[1] == 909670002.0
 
-    def test_ct_status_option_set_dedup(self):
-        df = self._make_input_df()
-        option_sets = self._make_option_sets()
+    def test_ct_status_option_set_dedup(self, make_input_df, option_sets):
+        df = make_input_df()
         _, cleaned = transform_clinical_trials(df, option_sets=option_sets)
         assert "_optionset_vin_ctstatus" in cleaned
         os_df = cleaned["_optionset_vin_ctstatus"]
@@ -515,9 +524,10 @@ class TestTransformClinicalTrials:
             "Withdrawn",
             "Unknown",
         }
+        assert len(option_sets["_optionset_vin_ctstatus"]) == 13
 
-    def test_renames_columns(self):
-        df = self._make_input_df()
+    def test_renames_columns(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert "ctphase" in result.columns
         assert "vin_ctphase" not in result.columns
@@ -530,8 +540,8 @@ class TestTransformClinicalTrials:
         assert "studytype" in result.columns
         assert "ctstatus" in result.columns
 
-    def test_renames_lastupdated(self):
-        df = self._make_input_df(
+    def test_renames_lastupdated(self, make_input_df):
+        df = make_input_df(
             {
                 "vin_lastupdated": ["2024-10-28T13:00:00Z", None],
             }
@@ -542,25 +552,31 @@ class TestTransformClinicalTrials:
         assert result["lastupdated"].iloc[0] == "2024-10-28T13:00:00Z"
         assert pd.isna(result["lastupdated"].iloc[1])
 
-    def test_returns_tuple(self):
-        df = self._make_input_df()
+    def test_returns_tuple(self, make_input_df):
+        df = make_input_df()
         result, cleaned = transform_clinical_trials(df)
         assert isinstance(result, pd.DataFrame)
         assert isinstance(cleaned, dict)
 
-    def test_does_not_modify_original(self):
-        df = self._make_input_df()
+    def test_does_not_modify_original(self, make_input_df):
+        df = make_input_df()
         original_columns = list(df.columns)
         transform_clinical_trials(df)
         assert list(df.columns) == original_columns
 
-    def test_preserves_row_count(self):
-        df = self._make_input_df()
+    def test_does_not_modify_original_values(self, make_input_df):
+        df = make_input_df()
+        snapshot = df.copy()
+        transform_clinical_trials(df)
+        pd.testing.assert_frame_equal(df, snapshot)
+
+    def test_preserves_row_count(self, make_input_df):
+        df = make_input_df()
         result, _ = transform_clinical_trials(df)
         assert len(result) == 2
 
-    def test_works_when_option_sets_is_none(self):
-        df = self._make_input_df()
+    def test_works_when_option_sets_is_none(self, make_input_df):
+        df = make_input_df()
         result, cleaned = transform_clinical_trials(df, option_sets=None)
         assert isinstance(result, pd.DataFrame)
         assert len(cleaned) == 0
@@ -1,6 +1,7 @@
 """Tests for developers transformation."""
 
 import pandas as pd
+import pytest
 
 from igh_data_transform.transformations.developers import (
     _enrich_from_accounts,
@@ -8,7 +9,7 @@ from igh_data_transform.transformations.developers import (
 )
 
 
-def _make_countries():
+def _build_countries():
     """Minimal vin_countries lookup table."""
     return pd.DataFrame(
         {
@@ -18,19 +19,18 @@ def _make_countries():
     )
 
 
-def _make_accounts(**overrides):
-    """Minimal accounts table with optional overrides."""
+def _build_accounts():
+    """Minimal accounts table."""
     data = {
         "accountid": ["acc-1", "acc-2"],
         "name": ["Acme Corp", "BioTech Inc"],
         "vin_organisationtype": ["For Profit SME", "5001"],
         "address1_country": ["France", "Türkiye"],
     }
-    data.update(overrides)
     return pd.DataFrame(data)
 
 
-def _make_developers(**overrides):
+def _build_developers():
     """Minimal vin_developers DataFrame."""
     data = {
         "vin_developerid": ["dev-1", "dev-2"],
@@ -61,117 +61,110 @@ def _make_developers(**overrides):
         # All-null column
         "empty_col": [None, None],
     }
-    data.update(overrides)
     return pd.DataFrame(data)
 
 
-class TestEnrichFromAccounts:
-    """Tests for _enrich_from_accounts function."""
+@pytest.fixture(scope="module")
+def make_countries(frame_factory):
+    """Copies of the vin_countries lookup, built once per module."""
+    return frame_factory(_build_countries)
 
-    def test_text_country_resolved(self):
-        """Country as text name matched via vin_countries.vin_name."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=["France", "France"])
-        countries = _make_countries()
 
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert result["country_name"].iloc[0] == "France"
-        assert result["country_name"].iloc[1] == "France"
+@pytest.fixture
+def countries(make_countries):
+    """Fresh vin_countries lookup for each test."""
+    return make_countries()
 
-    def test_numeric_country_code_resolved(self):
-        """Numeric country code resolved via vin_countryno."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=["4", "4"])
-        countries = _make_countries()
 
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert result["country_name"].iloc[0] == "France"
+@pytest.fixture(scope="module")
+def make_accounts(frame_factory):
+    """Copies of the accounts table, with optional column overrides."""
+    return frame_factory(_build_accounts)
 
-    def test_alias_country_resolved(self):
-        """Aliased country name (e.g. Türkiye) resolved to canonical name."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=["Türkiye", "Türkiye"])
-        countries = _make_countries()
 
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert result["country_name"].iloc[0] == "Turkey"
+@pytest.fixture(scope="module")
+def make_developers(frame_factory):
+    """Copies of the vin_developers frame, with optional column overrides."""
+    return frame_factory(_build_developers)
 
-    def test_no_account_match(self):
-        """Developer with no matching account gets NaN for enriched columns."""
-        df = _make_developers(_vin_developer_value=["no-match", "no-match"])
-        accounts = _make_accounts()
-        countries = _make_countries()
 
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert pd.isna(result["org_name"].iloc[0])
-        assert pd.isna(result["country_name"].iloc[0])
+class TestEnrichFromAccounts:
+    """Tests for _enrich_from_accounts function."""
 
-    def test_null_country(self):
-        """NULL country in accounts results in NaN country_name."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=[None, None])
-        countries = _make_countries()
+    @pytest.mark.parametrize(
+        "country_in,expected",
+        [
+            # Text name matched via vin_countries.vin_name
+            pytest.param(["France", "France"], "France", id="text"),
+            # Numeric country code resolved via vin_countryno
+            pytest.param(["4", "4"], "France", id="numeric_code"),
+            # Aliased name (e.g. Türkiye) resolved to the canonical name
+            pytest.param(["Türkiye", "Türkiye"], "Turkey", id="alias"),
+            # Matching is case-insensitive
+            pytest.param(["france", "FRANCE"], "France", id="case_insensitive"),
+            pytest.param([None, None], None, id="null"),
+            # "Not specified" in the alias table maps to None
+            pytest.param(["Not specified", "Not specified"], None, id="not_specified"),
+        ],
+    )
+    def test_country_resolution(
+        self, make_developers, make_accounts, countries, country_in, expected
+    ):
+        """address1_country is resolved to a canonical country_name."""
+        accounts = make_accounts(address1_country=country_in)
+
+        result = _enrich_from_accounts(make_developers(), accounts, countries)
+        if expected is None:
+            assert result["country_name"].isna().all()
+        else:
+            assert (result["country_name"] == expected).all()
+
+    def test_no_account_match(self, make_developers, make_accounts, countries):
+        """Developer with no matching account gets NaN for enriched columns."""
+        df = make_developers(_vin_developer_value=["no-match", "no-match"])
+        accounts = make_accounts()
 
         result = _enrich_from_accounts(df, accounts, countries)
+        assert pd.isna(result["org_name"].iloc[0])
         assert pd.isna(result["country_name"].iloc[0])
 
-    def test_numeric_org_type_nulled(self):
+    def test_numeric_org_type_nulled(self, make_developers, make_accounts, countries):
         """Purely numeric org type (e.g. '5001') is set to None."""
-        df = _make_developers()
-        accounts = _make_accounts(vin_organisationtype=["5001", "5003"])
-        countries = _make_countries()
+        df = make_developers()
+        accounts = make_accounts(vin_organisationtype=["5001", "5003"])
 
         result = _enrich_from_accounts(df, accounts, countries)
         assert pd.isna(result["vin_organisationtype"].iloc[0])
         assert pd.isna(result["vin_organisationtype"].iloc[1])
 
-    def test_text_org_type_preserved(self):
+    def test_text_org_type_preserved(self, make_developers, make_accounts, countries):
         """Text org type (e.g. 'For Profit SME') is preserved."""
-        df = _make_developers()
-        accounts = _make_accounts(
+        df = make_developers()
+        accounts = make_accounts(
             vin_organisationtype=["For Profit SME", "Academic/Research"]
         )
-        countries = _make_countries()
 
         result = _enrich_from_accounts(df, accounts, countries)
         assert result["vin_organisationtype"].iloc[0] == "For Profit SME"
         assert result["vin_organisationtype"].iloc[1] == "Academic/Research"
 
-    def test_address1_country_column_dropped(self):
+    def test_address1_country_column_dropped(
+        self, make_developers, make_accounts, countries
+    ):
         """Raw address1_country column is removed after resolution."""
-        df = _make_developers()
-        accounts = _make_accounts()
-        countries = _make_countries()
+        df = make_developers()
+        accounts = make_accounts()
 
         result = _enrich_from_accounts(df, accounts, countries)
         assert "address1_country" not in result.columns
         assert "country_name" in result.columns
 
-    def test_not_specified_country_resolves_to_null(self):
-        """'Not specified' in country alias maps to None."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=["Not specified", "Not specified"])
-        countries = _make_countries()
-
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert pd.isna(result["country_name"].iloc[0])
-
-    def test_case_insensitive_country_match(self):
-        """Country matching is case-insensitive."""
-        df = _make_developers()
-        accounts = _make_accounts(address1_country=["france", "FRANCE"])
-        countries = _make_countries()
-
-        result = _enrich_from_accounts(df, accounts, countries)
-        assert result["country_name"].iloc[0] == "France"
-        assert result["country_name"].iloc[1] == "France"
-
 
 class TestTransformDevelopers:
     """Tests for transform_developers function."""
 
-    def test_drops_metadata_columns(self):
-        df = _make_developers()
+    def test_drops_metadata_columns(self, make_developers):
+        df = make_developers()
         result, _ = transform_developers(df)
         for col in [
             "row_id",
@@ -185,8 +178,8 @@ class TestTransformDevelopers:
         ]:
             assert col not in result.columns
 
-    def test_renames_columns(self):
-        df = _make_developers()
+    def test_renames_columns(self, make_developers):
+        df = make_developers()
         result, _ = transform_developers(df)
         assert "developerid" in result.columns
         assert "vin_developerid" not in result.columns
@@ -197,54 +190,61 @@ class TestTransformDevelopers:
         assert "accountid" in result.columns
         assert "_vin_developer_value" not in result.columns
 
-    def test_drops_empty_columns_preserves_valid_to(self):
-        df = _make_developers()
+    def test_drops_empty_columns_preserves_valid_to(self, make_developers):
+        df = make_developers()
         result, _ = transform_developers(df)
         assert "valid_to" in result.columns
         assert "empty_col" not in result.columns
 
-    def test_works_without_lookup_tables(self):
-        df = _make_developers()
+    def test_works_without_lookup_tables(self, make_developers):
+        df = make_developers()
         result, cleaned = transform_developers(df, lookup_tables=None)
         assert isinstance(result, pd.DataFrame)
         assert len(cleaned) == 0
         # Without enrichment, no org_name or country_name columns
         assert "org_name" not in result.columns
 
-    def test_works_with_lookup_tables(self):
-        df = _make_developers()
+    def test_works_with_lookup_tables(self, make_developers, make_accounts, countries):
+        df = make_developers()
         lookup = {
-            "accounts": _make_accounts(),
-            "vin_countries": _make_countries(),
+            "accounts": make_accounts(),
+            "vin_countries": countries,
         }
         result, _ = transform_developers(df, lookup_tables=lookup)
         assert "org_name" in result.columns
         assert "country_name" in result.columns
         assert "org_type" in result.columns
 
-    def test_does_not_modify_original(self):
-        df = _make_developers()
-        original_columns = list(df.columns)
-        original_len = len(df)
-        transform_developers(df)
-        assert list(df.columns) == original_columns
-        assert len(df) == original_len
+    def test_does_not_modify_original(self, make_developers, make_accounts, countries):
+        df = make_developers()
+        accounts = make_accounts()
+        expected = df.copy()
+        expected_accounts = accounts.copy()
+        expected_countries = countries.copy()
+        transform_developers(
+            df, lookup_tables={"accounts": accounts, "vin_countries": countries}
+        )
+        pd.testing.assert_frame_equal(df, expected)
+        pd.testing.assert_frame_equal(accounts, expected_accounts)
+        pd.testing.assert_frame_equal(countries, expected_countries)
 
-    def test_returns_tuple_with_empty_dict(self):
-        df = _make_developers()
+    def test_returns_tuple_with_empty_dict(self, make_developers):
+        df = make_developers()
         result, cleaned = transform_developers(df)
         assert isinstance(result, pd.DataFrame)
         assert isinstance(cleaned, dict)
         assert len(cleaned) == 0
 
-    def test_org_type_renamed_from_vin_organisationtype(self):
+    def test_org_type_renamed_from_vin_organisationtype(
+        self, make_developers, make_accounts, countries
+    ):
         """vin_organisationtype is renamed to org_type after enrichment."""
-        df = _make_developers()
+        df = make_developers()
         lookup = {
-            "accounts": _make_accounts(
+            "accounts": make_accounts(
                 vin_organisationtype=["For Profit SME", "Academic/Research"]
             ),
-            "vin_countries": _make_countries(),
+            "vin_countries": countries,
         }
         result, _ = transform_developers(df, lookup_tables=lookup)
         assert "org_type" in result.columns
@@ -5,22 +5,28 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from igh_data_transform.transformations.silver_to_gold import silver_to_gold
 
 
+@pytest.fixture(scope="module")
+def sig() -> inspect.Signature:
+    """silver_to_gold's signature, resolved once for the module."""
+    return inspect.signature(silver_to_gold)
+
+
 class TestSilverToGold:
     """Tests for silver_to_gold function."""
 
-    def test_function_signature(self) -> None:
+    def test_function_signature(self, sig: inspect.Signature) -> None:
         """Test that silver_to_gold has the correct signature."""
-        sig = inspect.signature(silver_to_gold)
         params = list(sig.parameters.keys())
         assert params == ["silver_db_path", "gold_db_path"]
         assert sig.return_annotation is bool
 
-    def test_gold_db_path_defaults_to_none(self) -> None:
+    def test_gold_db_path_defaults_to_none(self, sig: inspect.Signature) -> None:
         """Test that gold_db_path has a default of None."""
-        sig = inspect.signature(silver_to_gold)
         assert sig.parameters["gold_db_path"].default is None
 
     def test_delegates_to_run_etl(self, tmp_path: Path) -> None: